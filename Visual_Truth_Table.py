@@ -10,9 +10,12 @@ educational content about logic operators and expressions.
 import sys
 import re
 import ast
+import contextlib
 import functools
 from itertools import product
 
+import numpy as np
+
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QPushButton, QLineEdit, QTableView, QSpinBox, QScrollArea, QCheckBox,
@@ -24,7 +27,8 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import (
     Qt, QSize, QAbstractTableModel, pyqtSignal, QModelIndex, QRegularExpression, 
-    QRect, QPoint, QPropertyAnimation, QEasingCurve, QTimer, QObject, pyqtProperty
+    QRect, QPoint, QPropertyAnimation, QEasingCurve, QTimer, QObject, pyqtProperty,
+    QSignalBlocker
 )
 from PyQt6.QtGui import (
     QColor, QBrush, QFont, QPainter, QPen, QIcon, QPixmap, QAction, QPalette, 
@@ -35,6 +39,16 @@ from PyQt6.QtGui import (
 # Import the KarnaughMapWidget
 from karnaugh_map_widget import KarnaughMapWidget
 
+# Qt-free core logic (re-exported here so existing
+# `from Visual_Truth_Table import ...` imports keep working)
+from truth_table_core import DisplayConfig, ExpressionEvaluator, _BoolToBitwise
+
+
+# Logical connective symbols that are never valid in variable names. A
+# frozenset gives O(1) membership for the per-keystroke check instead of
+# rebuilding and scanning a list literal on every keypress.
+_LOGICAL_SYMBOLS = frozenset({'∧', '∨', '¬', '→', '↔', '⊕'})
+
 
 # Custom QLineEdit subclass that restricts input to valid Python identifiers
 class IdentifierLineEdit(QLineEdit):
@@ -48,7 +62,32 @@ class IdentifierLineEdit(QLineEdit):
     - Prevents Enter key from triggering form submission
     - Avoids overwriting user input when possible
     """
-    
+
+    # Complete stylesheets for each validation state, built once at class
+    # definition. Qt re-parses a stylesheet every time setStyleSheet is
+    # called, so the per-keystroke string concatenation the handler used to
+    # do paid for both a new string and a full QSS parse on every character.
+    _NEUTRAL_STYLE = """
+            QLineEdit {
+                padding: 8px;
+                border: 1px solid #aaa;
+                border-radius: 4px;
+                font-size: 14px;
+            }
+        """
+    _VALID_STYLE = _NEUTRAL_STYLE + """
+            QLineEdit {
+                background-color: #eeffee;
+                border-color: #5cb85c;
+            }
+        """
+    _INVALID_STYLE = _NEUTRAL_STYLE + """
+            QLineEdit {
+                background-color: #ffeeee;
+                border-color: #d9534f;
+            }
+        """
+
     def __init__(self, parent=None):
         super().__init__(parent)
         
@@ -59,19 +98,24 @@ class IdentifierLineEdit(QLineEdit):
         validator = QRegularExpressionValidator(QRegularExpression(r'[A-Za-z_][A-Za-z0-9_]*'))
         self.setValidator(validator)
         
-        # Connect text change signal to validation method
-        self.textChanged.connect(self._validate_text)
-        
+        # Debounce validation behind a single-shot timer: during a typing
+        # burst each keystroke just restarts the timer, and the validator
+        # runs once when the user pauses instead of once per character.
+        self._validation_timer = QTimer(self)
+        self._validation_timer.setSingleShot(True)
+        self._validation_timer.setInterval(80)
+        self._validation_timer.timeout.connect(
+            lambda: self._validate_text(self.text()))
+        self.textChanged.connect(self._validation_timer.start)
+
         # Base stylesheet for this widget
-        self.base_style = """
-            QLineEdit {
-                padding: 8px;
-                border: 1px solid #aaa;
-                border-radius: 4px;
-                font-size: 14px;
-            }
-        """
+        self.base_style = self._NEUTRAL_STYLE
         self.setStyleSheet(self.base_style)
+
+        # Last validation state ('neutral'/'valid'/'invalid'), used to skip
+        # redundant restyling when consecutive keystrokes land in the same
+        # state (the common case while typing a valid name).
+        self._last_state = 'neutral'
     
     def keyPressEvent(self, event):
         """
@@ -97,7 +141,7 @@ class IdentifierLineEdit(QLineEdit):
             matches_pattern = bool(re.match(r'^[A-Za-z_][A-Za-z0-9_]*$', potential_text))
 
             # Special handling for logical symbols - never allowed in identifiers
-            if key_char in ['∧', '∨', '¬', '→', '↔', '⊕']:
+            if key_char in _LOGICAL_SYMBOLS:
                 event.accept()  # Accept but don't process
                 # Show a tooltip explaining why symbol isn't allowed
                 self.setToolTip("Logical symbols cannot be used in variable names")
@@ -144,31 +188,28 @@ class IdentifierLineEdit(QLineEdit):
         """
         if not text:
             # Empty text is fine (visually neutral)
-            self.setStyleSheet(self.base_style)
-            self.setToolTip("Enter a valid variable name (letters, numbers, underscore)")
+            if self._last_state != 'neutral':
+                self._last_state = 'neutral'
+                self.setStyleSheet(self._NEUTRAL_STYLE)
+                self.setToolTip("Enter a valid variable name (letters, numbers, underscore)")
             return
-            
+
         # Check if the text is a valid Python identifier
         valid = text.isidentifier()
-        
+
         if valid:
-            # Valid - green tint
-            self.setStyleSheet(self.base_style + """
-                QLineEdit {
-                    background-color: #eeffee;
-                    border-color: #5cb85c;
-                }
-            """)
-            self.setToolTip("Valid variable name")
+            # Valid - green tint; restyle only on a state change so typing
+            # character after character of a valid name costs no QSS re-parse
+            if self._last_state != 'valid':
+                self._last_state = 'valid'
+                self.setStyleSheet(self._VALID_STYLE)
+                self.setToolTip("Valid variable name")
         else:
             # Invalid - red tint
-            self.setStyleSheet(self.base_style + """
-                QLineEdit {
-                    background-color: #ffeeee;
-                    border-color: #d9534f;
-                }
-            """)
-            # More specific error messages
+            if self._last_state != 'invalid':
+                self._last_state = 'invalid'
+                self.setStyleSheet(self._INVALID_STYLE)
+            # More specific error messages (may change while invalid)
             if not text[0].isalpha() and text[0] != '_':
                 self.setToolTip("Variable names must start with a letter or underscore")
             else:
@@ -746,372 +787,6 @@ class AppTheme:
         """
 
 
-class ExpressionEvaluator:
-    # This class is designed for the safe parsing and evaluation of logical expressions provided by the user.
-    # It uses Python's Abstract Syntax Tree (ast) module to analyze the structure of an expression
-    # before evaluation. This is a crucial security measure to prevent the execution of arbitrary
-    # or malicious code, as it allows only a whitelisted set of Python language features typical
-    # of logical expressions.
-    # It also handles the normalization of common logical symbols (e.g., '→', '∧') into their
-    # Python equivalents (e.g., '<=', 'and').
-    # This class does not have a UI component itself but provides the backend logic for expression handling.
-    """Safe AST-based parser and evaluator for logical expressions"""
-
-    # Allowed AST node types for safe evaluation - add ast.Expression
-    # This set defines all Python AST node types that are permitted within a user-submitted expression.
-    # If an expression, when parsed, contains any node type not in this set (e.g., function calls,
-    # import statements, loops), it will be considered invalid or unsafe.
-    # This whitelist is fundamental to the security of the expression evaluation.
-    ALLOWED_NODES = {
-        ast.Module,  # Represents a_module (usually the root of a script, but relevant if parsing with mode='exec')
-        ast.Expr,
-        # Represents an expression that is evaluated and its result discarded (e.g., a standalone literal or operation)
-        ast.BoolOp,  # Represents boolean operations like 'and' and 'or'. Specific ops are ast.And, ast.Or.
-        ast.UnaryOp,  # Represents unary operations like 'not'. Specific op is ast.Not.
-        ast.Name,  # Represents a variable name (e.g., 'p', 'q'). Used with ast.Load when reading the variable.
-        ast.And,  # Specific AST node for the 'and' boolean operation.
-        ast.Or,  # Specific AST node for the 'or' boolean operation.
-        ast.Not,  # Specific AST node for the 'not' unary operation.
-        ast.Compare,  # Represents comparison operations (e.g., ==, !=, <, <=, >, >=).
-        ast.Eq,  # Specific AST node for equality comparison (==).
-        ast.NotEq,  # Specific AST node for inequality comparison (!=).
-        ast.Lt,  # Specific AST node for less than comparison (<).
-        ast.LtE,  # Specific AST node for less than or equal to comparison (<=).
-        ast.Gt,  # Specific AST node for greater than comparison (>).
-        ast.GtE,  # Specific AST node for greater than or equal to comparison (>=).
-        ast.Load,  # Indicates that a variable name (ast.Name) is being read/loaded.
-        ast.Constant,
-        # Represents literal constants like True, False, numbers, strings. (Replaced ast.Num, ast.Str, ast.NameConstant in newer Python).
-        ast.Expression  # The root node for an expression parsed with mode='eval'. This is important.
-    }
-
-    # Symbol mapping for display and parsing
-    # This dictionary maps common logical symbols to their Python string equivalents.
-    # This allows users to input expressions using familiar mathematical/logical notation,
-    # which are then translated by _normalize_expression before AST parsing.
-    SYMBOL_MAP = {
-        '→': '<=',
-        # Implication (p → q is equivalent to not p or q; for booleans 0/1, p <= q also works: 0<=0, 0<=1, 1<=1 are True, 1<=0 is False)
-        '↔': '==',  # Equivalence (biconditional)
-        '⊕': '!=',  # XOR (exclusive OR)
-        '∧': 'and',  # Conjunction (AND)
-        '∨': 'or',  # Disjunction (OR)
-        '¬': 'not '  # NOT (negation). Note the trailing space to ensure correct parsing (e.g. 'not p' vs 'notp')
-    }
-
-    @classmethod
-    # This decorator indicates that is_valid_expression is a class method.
-    # It can be called on the class itself (e.g., ExpressionEvaluator.is_valid_expression()).
-    # It receives the class (cls) as its first argument automatically.
-    def is_valid_expression(cls, expr):
-        # Purpose: Checks if a given expression string is syntactically valid Python for a logical expression
-        #          and, more importantly, if it only contains allowed operations (AST nodes).
-        # Parameters:
-        #   expr (str): The expression string to validate.
-        # Returns:
-        #   tuple (bool, str): A boolean indicating validity (True if valid, False otherwise),
-        #                      and a string message explaining the status or error.
-        # Concepts: AST parsing (ast.parse), AST traversal (ast.walk), error handling (try-except).
-        # Connection: Called by ExpressionWidget._validate_expression to provide real-time feedback to the user
-        #             as they type an expression into a QLineEdit.
-        """Check if expression is syntactically valid and safe"""
-        if not expr.strip():  # Check if the expression is empty or only whitespace.
-            return False, "Expression cannot be empty"
-
-        try:
-            # Step 1: Normalize the expression (replace symbols with Python operators).
-            py_expr = cls._normalize_expression(expr)
-
-            # Step 2: Parse the normalized expression into an Abstract Syntax Tree (AST).
-            # mode='eval' is used because we expect a single expression that returns a value.
-            # If parsing fails (e.g., syntax error), a SyntaxError will be raised.
-            tree = ast.parse(py_expr, mode='eval')
-
-            # Step 3: Traverse the AST to check if all nodes are allowed.
-            # ast.walk(tree) generates all nodes in the tree in no specific order.
-            for node in ast.walk(tree):
-                if type(node) not in cls.ALLOWED_NODES:  # Check node type against the whitelist.
-                    # If an unsupported node type is found, the expression is deemed unsafe/invalid.
-                    return False, f"Unsupported operation: {type(node).__name__}"
-
-            # If parsing and all node checks pass, the expression is considered valid.
-            return True, "Valid expression"
-        except SyntaxError as e:
-            # Catch Python syntax errors during parsing.
-            return False, f"Syntax error: {str(e)}"
-        except Exception as e:
-            # Catch any other unexpected errors during validation.
-            return False, f"Error: {str(e)}"
-
-    @classmethod
-    # Class method for evaluating a pre-validated logical expression.
-    def evaluate(cls, expr, var_dict):
-        # Purpose: Evaluates a given logical expression string using a dictionary of variable values.
-        #          This method assumes the expression has already been somewhat validated for safety by
-        #          is_valid_expression or similar checks, but it re-validates AST nodes as a safeguard.
-        # Parameters:
-        #   expr (str): The logical expression string to evaluate.
-        #   var_dict (dict): A dictionary mapping variable names (str) to their boolean values (bool).
-        #                    Example: {'p': True, 'q': False}
-        # Returns:
-        #   bool: The boolean result of the evaluated expression.
-        # Raises:
-        #   ValueError: If the expression is empty, contains unsupported operations, or other evaluation issues occur.
-        #   NameError: If the expression uses variables not defined in var_dict.
-        # Concepts: AST parsing, AST compilation (compile), restricted evaluation (eval with limited globals/locals),
-        #           error handling, string normalization.
-        # Connection: Primarily called by TruthTableModel._generate_data to calculate the truth values for each
-        #             expression column in the truth table for every row of variable assignments.
-        """Evaluate a logical expression with the given variable values"""
-        if not expr.strip():  # Ensure the expression is not empty.
-            raise ValueError("Expression cannot be empty")
-
-        try:
-            # Debug output - useful during development, can be removed or made conditional for production.
-            print(f"Evaluating expression: '{expr}'")
-            print(f"Variables available: {var_dict}")
-
-            # Step 1: Normalize the expression (replace symbols with Python operators).
-            py_expr = cls._normalize_expression(expr)
-            print(f"Normalized expression: '{py_expr}'")
-
-            # Step 2: Parse the normalized expression into an AST.
-            tree = ast.parse(py_expr, mode='eval')
-
-            # Step 3: Walk the AST to check for allowed nodes and identify all variable names used.
-            # This is a reinforcement of the safety check and helps identify required variables.
-            variables_in_expr = set()  # Using a set to store unique variable names found.
-            for node in ast.walk(tree):
-                node_type = type(node)
-                print(f"Node type: {node_type.__name__}")  # Debugging: shows AST node types being processed.
-                if node_type not in cls.ALLOWED_NODES:
-                    raise ValueError(f"Unsupported operation: {node_type.__name__}")
-                if isinstance(node, ast.Name):  # If the node is a variable name identifier.
-                    variables_in_expr.add(node.id)  # Add its name (id) to the set.
-                    print(f"Found variable reference: {node.id}")  # Debugging.
-
-            print(f"Variables in expression: {variables_in_expr}")  # Debugging.
-
-            # Step 4: Ensure all variables used in the expression are provided in var_dict.
-            # This prevents NameError during evaluation if a variable is used but not defined.
-            missing_vars = [v for v in variables_in_expr if v not in var_dict]
-            if missing_vars:
-                # This is a critical error if the expression refers to variables not in the context.
-                print(f"CRITICAL ERROR: Variables missing from dictionary: {missing_vars}")
-                print(f"Available keys: {list(var_dict.keys())}")
-                raise NameError(f"Undefined variable(s): {{', '.join(missing_vars)}}")
-
-            # Step 5: Compile the AST into a code object.
-            # '<string>' is a placeholder for the filename in tracebacks.
-            # 'eval' mode indicates the code object should represent a single expression.
-            code = compile(tree, '<string>', 'eval')
-
-            # Step 6: Create a safe evaluation environment (locals for eval).
-            # It includes Python's True/False and the user-provided variables from var_dict.
-            # All variable names (keys) from var_dict are explicitly cast to str, and values to bool,
-            # to ensure consistency, though var_dict keys should already be strings from variable names.
-            safe_globals = {"__builtins__": {}}  # CRITICAL: Restrict access to built-in functions.
-            safe_locals = {'True': True, 'False': False}
-            for key, value in var_dict.items():
-                safe_locals[str(key)] = bool(value)
-
-            print(f"Safe evaluation dictionary: {safe_locals}")  # Debugging.
-
-            # Step 7: Execute the compiled code.
-            # The first argument to eval is the code object.
-            # The second (globals) is restricted to prevent access to unsafe built-ins.
-            # The third (locals) provides the context (True, False, and variable values).
-            result = eval(code, safe_globals, safe_locals)
-
-            # Step 8: Ensure the result is always a boolean.
-            bool_result = bool(result)
-            print(f"Result: {bool_result}")  # Debugging.
-            return bool_result
-
-        except Exception as e:
-            # Catch any error during evaluation (e.g., NameError if somehow missed, TypeError for operations on wrong types)
-            # and re-raise it as a ValueError to be handled by the caller (e.g., TruthTableModel).
-            print(f"Error evaluating expression '{expr}': {e}")
-            raise ValueError(f"Error evaluating '{expr}': {str(e)}")
-
-    @classmethod
-    # Helper class method to convert an expression string with custom logical symbols
-    # into a standard Python expression string.
-    def _normalize_expression(cls, expr):
-        # Purpose: To allow users to input expressions using common logical symbols (like '→', '∧')
-        #          and have them automatically converted to Python's equivalent operators ('and', 'or', etc.)
-        #          before parsing and evaluation.
-        # Parameters:
-        #   expr (str): The raw expression string from the user.
-        # Returns:
-        #   str: The expression string with symbols replaced by Python keywords/operators.
-        # Concepts: String manipulation (strip, replace), iteration over a dictionary.
-        # Connection: Called internally by is_valid_expression and evaluate as a preprocessing step.
-        """Convert expression with various notations to Python syntax"""
-        py_expr = expr.strip()  # Remove leading/trailing whitespace.
-
-        # Iterate through the SYMBOL_MAP dictionary.
-        for symbol, op_keyword in cls.SYMBOL_MAP.items():
-            # Replace each occurrence of the symbol (e.g., '∧') with its Python operator string (e.g., 'and').
-            py_expr = py_expr.replace(symbol, op_keyword)
-
-        return py_expr
-
-    @classmethod
-    # Class method to generate a simplified, human-readable step-by-step explanation of an expression's evaluation.
-    def get_evaluation_steps(cls, expr, var_dict):
-        # Purpose: To provide users with a textual breakdown of how an expression is evaluated,
-        #          which is useful for educational purposes.
-        # Parameters:
-        #   expr (str): The original expression string.
-        #   var_dict (dict): A dictionary of variable names to their boolean values for a specific scenario (e.g., a truth table row).
-        # Returns:
-        #   list[str]: A list of strings, where each string is a step in the evaluation explanation.
-        #              Returns a list with an error message if an issue occurs.
-        # Concepts: String manipulation, calling cls.evaluate for the final result.
-        # Connection: Called by ExplanationWidget.update_step_evaluation to display these steps in the UI.
-        # Note: This provides a simplified, high-level view of evaluation, not a true AST-based step-by-step evaluation.
-        """Generate step-by-step explanation for expression evaluation"""
-        if not expr.strip():  # Handle empty expression case.
-            return ["Error: Expression is empty"]
-
-        try:
-            # Store the original expression for evaluation
-            orig_expr_str = expr # Renamed to avoid conflict with 'expr' parameter
-
-            # Create a display version of the expression, replacing Python keywords with logical symbols
-            display_expr_str = orig_expr_str # Renamed
-            # Create a reversed symbol map to convert Python operators back to logical symbols
-            reversed_map_dict = {} # Renamed
-            for symbol_char, op_keyword in cls.SYMBOL_MAP.items(): # Renamed loop variables
-                # Special handling for 'not ' because it has a space
-                if op_keyword == 'not ':
-                    reversed_map_dict['not'] = symbol_char
-                else:
-                    reversed_map_dict[op_keyword] = symbol_char
-            
-            # Apply the reversed map to create a more readable display version
-            for op_keyword, symbol_char in reversed_map_dict.items(): # Renamed loop variables
-                # Use regex with word boundaries to only replace whole operators
-                import re
-                display_expr_str = re.sub(r'\\b' + re.escape(op_keyword) + r'\\b', symbol_char, display_expr_str)
-            
-            steps_list = [f"Starting with expression: {display_expr_str}"] # Renamed
-            
-            # 1. Substitute variable values with their boolean values
-            steps_list.append("1. Substitute variable values:")
-            substituted_expr_str = display_expr_str # Renamed
-            for var_name_str, var_value_bool in var_dict.items(): # Renamed loop variables
-                # Use regex with word boundaries to avoid partial replacements
-                substituted_expr_str = re.sub(r'\\b' + re.escape(var_name_str) + r'\\b', 
-                                         f"<b>{str(var_value_bool).lower()}</b>", 
-                                         substituted_expr_str)
-            steps_list.append(f"   {substituted_expr_str}")
-            
-            # 2. Evaluate negations (¬) - highest precedence
-            steps_list.append("2. Evaluate negations (¬):")
-            # Find all patterns like "¬<b>true</b>" or "¬<b>false</b>" and evaluate them
-            negation_pattern_re = r'¬\\s*<b>(true|false)</b>' # Renamed
-            
-            current_eval_step_str = substituted_expr_str # Renamed
-            negation_match_obj = re.search(negation_pattern_re, current_eval_step_str) # Renamed
-            if negation_match_obj:
-                # Process all negations
-                while negation_match_obj:
-                    neg_expr_str = negation_match_obj.group(0) # Renamed
-                    value_str_from_match = negation_match_obj.group(1) # Renamed
-                    result_bool = not (value_str_from_match.lower() == "true") # Renamed
-                    result_str_html = f"<b>{str(result_bool).lower()}</b>" # Renamed
-                    
-                    # Replace just this specific negation
-                    current_eval_step_str = current_eval_step_str.replace(neg_expr_str, result_str_html, 1)
-                    
-                    # Look for next negation
-                    negation_match_obj = re.search(negation_pattern_re, current_eval_step_str)
-                
-                steps_list.append(f"   {current_eval_step_str}")
-            else:
-                steps_list.append("   No negations to evaluate")
-            
-            # 3. Evaluate AND operations (∧) - second precedence
-            steps_list.append("3. Evaluate AND operations (∧):")
-            # Find all patterns like "<b>true</b> ∧ <b>false</b>" and evaluate them
-            and_pattern_re = r'<b>(true|false)</b>\\s*∧\\s*<b>(true|false)</b>' # Renamed
-            
-            and_match_obj = re.search(and_pattern_re, current_eval_step_str) # Renamed
-            if and_match_obj:
-                # Process all AND operations
-                while and_match_obj:
-                    and_expr_str = and_match_obj.group(0) # Renamed
-                    left_value_bool = and_match_obj.group(1).lower() == "true" # Renamed
-                    right_value_bool = and_match_obj.group(2).lower() == "true" # Renamed
-                    result_bool = left_value_bool and right_value_bool # Renamed
-                    result_str_html = f"<b>{str(result_bool).lower()}</b>" # Renamed
-                    
-                    # Replace just this AND operation
-                    current_eval_step_str = current_eval_step_str.replace(and_expr_str, result_str_html, 1)
-                    
-                    # Look for next AND operation
-                    and_match_obj = re.search(and_pattern_re, current_eval_step_str)
-                
-                steps_list.append(f"   {current_eval_step_str}")
-            else:
-                steps_list.append("   No AND operations to evaluate")
-            
-            # 4. Evaluate OR operations (∨) - lowest precedence
-            steps_list.append("4. Evaluate OR operations (∨):")
-            # Find all patterns like "<b>true</b> ∨ <b>false</b>" and evaluate them
-            or_pattern_re = r'<b>(true|false)</b>\\s*∨\\s*<b>(true|false)</b>' # Renamed
-            
-            or_match_obj = re.search(or_pattern_re, current_eval_step_str) # Renamed
-            if or_match_obj:
-                # Process all OR operations
-                while or_match_obj:
-                    or_expr_str = or_match_obj.group(0) # Renamed
-                    left_value_bool = or_match_obj.group(1).lower() == "true" # Renamed
-                    right_value_bool = or_match_obj.group(2).lower() == "true" # Renamed
-                    result_bool = left_value_bool or right_value_bool # Renamed
-                    result_str_html = f"<b>{str(result_bool).lower()}</b>" # Renamed
-                    
-                    # Replace just this OR operation
-                    current_eval_step_str = current_eval_step_str.replace(or_expr_str, result_str_html, 1)
-                    
-                    # Look for next OR operation
-                    or_match_obj = re.search(or_pattern_re, current_eval_step_str)
-                
-                steps_list.append(f"   {current_eval_step_str}")
-            else:
-                steps_list.append("   No OR operations to evaluate")
-            
-            # 5. Evaluate other operations (→, ↔, ⊕) if present
-            # Implication (→)
-            implies_pattern_re = r'<b>(true|false)</b>\\s*→\\s*<b>(true|false)</b>' # Renamed
-            implies_match_obj = re.search(implies_pattern_re, current_eval_step_str) # Renamed
-            if implies_match_obj:
-                steps_list.append("5. Evaluate implications (→):")
-                
-                while implies_match_obj:
-                    implies_expr_str = implies_match_obj.group(0) # Renamed
-                    left_value_bool = implies_match_obj.group(1).lower() == "true" # Renamed
-                    right_value_bool = implies_match_obj.group(2).lower() == "true" # Renamed
-                    # p → q is equivalent to (not p) or q
-                    result_bool = (not left_value_bool) or right_value_bool # Renamed
-                    result_str_html = f"<b>{str(result_bool).lower()}</b>" # Renamed
-                    
-                    current_eval_step_str = current_eval_step_str.replace(implies_expr_str, result_str_html, 1)
-                    implies_match_obj = re.search(implies_pattern_re, current_eval_step_str)
-                
-                steps_list.append(f"   {current_eval_step_str}")
-            
-            # Get the actual final result using the evaluator
-            final_result_bool = cls.evaluate(orig_expr_str, var_dict)
-            steps_list.append(f"Final result: <b>{str(final_result_bool).lower()}</b>")
-            
-            return steps_list
-        except Exception as e:
-            return [f"Error generating steps: {str(e)}"]
-
-
 class VariableConfigWidget(QWidget):
     # This class defines a custom QWidget responsible for the UI section where users configure
     # the number of variables and their names for the truth table.
@@ -1511,7 +1186,10 @@ class ExpressionWidget(QWidget):
         
         # List to track expression input fields
         self.input_fields = []
-        
+
+        # Maps id(field) -> row index; kept in sync with input_fields
+        self._field_index = {}
+
         # Build the UI
         self._build_ui()
         
@@ -1832,7 +1510,11 @@ class ExpressionWidget(QWidget):
 
             # *** Add focus tracking ***
             line_edit.focusInEvent = functools.partial(self._on_expression_focus, line_edit)
-            
+
+        # O(1) widget -> row index lookups for hot paths like insert_symbol;
+        # rebuilt whenever the expression rows are recreated
+        self._field_index = {id(f): i for i, f in enumerate(self.input_fields)}
+
     def _on_expression_focus(self, line_edit, _event): # Renamed event to _event
         """Store the line edit that gained focus."""
         self.last_focused_input = line_edit
@@ -2441,95 +2123,25 @@ class ExplanationWidget(QWidget):
         self.step_text.setHtml(html)
 
 
-class DisplayConfig:
+@functools.lru_cache(maxsize=16)
+def _assignment_rows(n, reverse=False):
     """
-    Configuration class for managing truth table display formats.
-    
-    This class defines the available display modes for the truth table and provides
-    methods to control how the data is displayed.
+    All 2**n True/False combinations for n variables, cached by (n, reverse).
+
+    The combinations are a pure function of the variable count and row order,
+    so regenerating a table with the same shape reuses the cached tuple
+    instead of rebuilding the itertools.product expansion.
     """
-    
-    # Display mode constants
-    TF_MODE = "T/F"       # True as "T", False as "F" 
-    BINARY_MODE = "1/0"   # True as "1", False as "0"
-    
-    # Row order constants
-    STANDARD_ORDER = "Standard"    # FFF, FFT, FTF, FTT, etc.
-    REVERSED_ORDER = "Reversed"    # TTT, TTF, TFT, TFF, etc.
-    
-    # Available display modes
-    AVAILABLE_DISPLAY_MODES = [TF_MODE, BINARY_MODE]
-    
-    # Available row orders
-    AVAILABLE_ROW_ORDERS = [STANDARD_ORDER, REVERSED_ORDER]
-    
-    def __init__(self):
-        """Initialize display configuration with default settings"""
-        # Default display modes
-        self.variable_display = self.BINARY_MODE
-        self.expression_display = self.TF_MODE
-        
-        # Default row order
-        self.row_order = self.STANDARD_ORDER
-    
-    def format_variable(self, value):
-        """
-        Format a boolean value for variable display based on current mode
-        
-        Parameters:
-            value (bool): The boolean value to format
-            
-        Returns:
-            str: Formatted string representation
-        """
-        if self.variable_display == self.TF_MODE:
-            return "T" if value else "F"
-        elif self.variable_display == self.BINARY_MODE:
-            return "1" if value else "0"
-        # Fallback
-        return str(value)
-    
-    def format_expression(self, value):
-        """
-        Format a boolean value for expression display based on current mode
-        
-        Parameters:
-            value (bool): The boolean value to format
-            
-        Returns:
-            str: Formatted string representation
-        """
-        if self.expression_display == self.TF_MODE:
-            return "T" if value else "F"
-        elif self.expression_display == self.BINARY_MODE:
-            return "1" if value else "0"
-        # Fallback
-        return str(value)
-    
-    def set_variable_display(self, mode):
-        """Set display mode for variables"""
-        if mode in self.AVAILABLE_DISPLAY_MODES:
-            self.variable_display = mode
-            return True
-        return False
-    
-    def set_expression_display(self, mode):
-        """Set display mode for expressions"""
-        if mode in self.AVAILABLE_DISPLAY_MODES:
-            self.expression_display = mode
-            return True
-        return False
-        
-    def set_row_order(self, order):
-        """Set the row order for the truth table"""
-        if order in self.AVAILABLE_ROW_ORDERS:
-            self.row_order = order
-            return True
-        return False
-        
-    def should_reverse_rows(self):
-        """Check if rows should be displayed in reverse order"""
-        return self.row_order == self.REVERSED_ORDER
+    rows = tuple(product((False, True), repeat=n))
+    return rows[::-1] if reverse else rows
+
+
+@functools.lru_cache(maxsize=16)
+def _assignment_matrix(n, reverse=False):
+    """NumPy boolean view of _assignment_rows, cached and marked read-only."""
+    matrix = np.array(_assignment_rows(n, reverse), dtype=bool)
+    matrix.setflags(write=False)
+    return matrix
 
 
 class TruthTableModel(QAbstractTableModel):
@@ -2541,7 +2153,23 @@ class TruthTableModel(QAbstractTableModel):
     the Qt Model-View architecture through QAbstractTableModel, providing methods that
     the view (QTableView) will call to request data for display.
     """
-    
+
+    # Brushes and font served to the view, built once at class creation.
+    # data()/headerData() run once per cell per repaint; allocating a fresh
+    # QBrush (and derived lighter/darker QColor) there churns thousands of
+    # temporaries for a 2^n-row table, so every constant answer is shared.
+    _PANEL_BRUSH = QBrush(AppTheme.PANEL)
+    _TRUE_BG_BRUSH = QBrush(AppTheme.TRUE_COLOR.lighter(140))
+    _FALSE_BG_BRUSH = QBrush(AppTheme.FALSE_COLOR.lighter(140))
+    _TRUE_FG_BRUSH = QBrush(AppTheme.TRUE_COLOR.darker(150))
+    _FALSE_FG_BRUSH = QBrush(AppTheme.FALSE_COLOR.darker(150))
+    _ERROR_BRUSH = QBrush(AppTheme.ERROR)
+    _TEXT_BRUSH = QBrush(AppTheme.TEXT_PRIMARY)
+    _HEADER_VAR_BRUSH = QBrush(AppTheme.SECONDARY)
+    _HEADER_ROW_BRUSH = QBrush(AppTheme.SECONDARY.lighter(140))
+    _HEADER_DEFAULT_BRUSH = QBrush(AppTheme.PRIMARY)
+    _HEADER_TEXT_BRUSH = QBrush(QColor(255, 255, 255))
+
     def __init__(self, parent=None):
         """
         Initialize the truth table model.
@@ -2560,13 +2188,35 @@ class TruthTableModel(QAbstractTableModel):
         self.variable_names = ["p", "q"]  # Default variable names
         self.expressions = ["p and q"]  # Default expression
         self.expr_colors = [QColor(91, 192, 222)]  # Default color for expression
+        # Header brushes matching expr_colors, rebuilt whenever the colors
+        # change so headerData never allocates per repaint
+        self._expr_header_brushes = [QBrush(c) for c in self.expr_colors]
+        # Bold font for expression columns, built once per model
+        self._bold_font = QFont()
+        self._bold_font.setBold(True)
         self.truth_values = []  # Will store all combinations of True/False
         self.results = []  # Will store evaluation results
-        
+
+        # Dense boolean matrix of results (2^n rows x m expressions), kept
+        # alongside the list form when the kernel path produced it; None
+        # after a row-wise fallback. Column reads come from here without
+        # touching the Python lists.
+        self._results_matrix = None
+        # Backing storage for _results_matrix, grown geometrically and kept
+        # across recalculations so interactive expression edits reuse the
+        # same allocation instead of building a new matrix each time.
+        self._results_buf = None
+
         # Display configuration
         self.display_config = DisplayConfig()
-        
+
+        # Compiled NumPy kernel that evaluates every expression over whole
+        # truth-value columns at once. Rebuilt only when the variable names
+        # or expressions change; None when an expression cannot be compiled.
+        self._kernel = None
+
         # Initialize the data
+        self._build_kernel()
         self._generate_data()
     
     def rowCount(self, parent=QModelIndex()):
@@ -2597,7 +2247,47 @@ class TruthTableModel(QAbstractTableModel):
             int: Number of columns in the truth table.
         """
         return len(self.variable_names) + len(self.expressions)
-    
+
+    def get_column_array(self, col):
+        """
+        Return one table column as a NumPy boolean array.
+
+        Columns are ordered like data(): variables first, then expressions.
+        Fetching a whole column at once lets callers compare all 2^n values
+        in a single vectorized operation instead of 2^n data() calls.
+
+        Parameters:
+            col (int): Column index (0-based, across variables then expressions).
+
+        Returns:
+            numpy.ndarray: Boolean array with one entry per table row.
+        """
+        n_vars = len(self.variable_names)
+        if col < n_vars:
+            # Variable columns are a slice of the cached assignment matrix
+            # (read-only view, no per-row iteration needed).
+            return _assignment_matrix(*self._truth_values_key)[:, col]
+        idx = col - n_vars
+        if self._results_matrix is not None:
+            # Kernel path: the dense result matrix serves the column directly.
+            return self._results_matrix[:, idx]
+        rows = self.results
+        return np.fromiter((row[idx] for row in rows), dtype=bool, count=len(rows))
+
+    def _variable_value(self, row, col):
+        """
+        Truth value of variable column `col` at table row `row`.
+
+        In standard order the assignments enumerate the row index in binary
+        with the first variable as the most significant bit, so the value is
+        just a bit of the row index — no table lookup required. Reversing
+        the row order complements the index, which flips every bit.
+        """
+        n = len(self.variable_names)
+        if self.display_config.should_reverse_rows():
+            row = (1 << n) - 1 - row
+        return bool((row >> (n - 1 - col)) & 1)
+
     def data(self, index, role=Qt.ItemDataRole.DisplayRole):
         """
         Return the data for a given cell based on the specified role.
@@ -2625,10 +2315,12 @@ class TruthTableModel(QAbstractTableModel):
         
         # Display role - what to show in the cell
         if role == Qt.ItemDataRole.DisplayRole:
-            # Variable columns - use display format from config
+            # Variable columns - use display format from config. The value
+            # is derived arithmetically from the row index (see
+            # _variable_value), avoiding the tuple indexing per repaint.
             if col < len(self.variable_names):
-                value = self.truth_values[row][col]
-                return self.display_config.format_variable(value)
+                return self.display_config.format_variable(
+                    self._variable_value(row, col))
             
             # Expression columns - use display format from config
             expr_idx = col - len(self.variable_names)
@@ -2642,21 +2334,19 @@ class TruthTableModel(QAbstractTableModel):
         if role == Qt.ItemDataRole.BackgroundRole:
             # Variable columns - light gray background
             if col < len(self.variable_names):
-                return QBrush(AppTheme.PANEL)
-            
+                return self._PANEL_BRUSH
+
             # Expression columns - colored background based on result
             expr_idx = col - len(self.variable_names)
             if expr_idx < len(self.results[row]):
                 value = self.results[row][expr_idx]
-                
+
                 if value is None:
-                    return QBrush(AppTheme.PANEL)  # Neutral color for None/error
+                    return self._PANEL_BRUSH  # Neutral color for None/error
                 elif value:  # If TRUE (regardless of display mode)
-                    # True value - use AppTheme.TRUE_COLOR
-                    return QBrush(AppTheme.TRUE_COLOR.lighter(140))  # Slightly lighter for readability
+                    return self._TRUE_BG_BRUSH  # Slightly lighter for readability
                 else:  # If FALSE (regardless of display mode)
-                    # False value - use AppTheme.FALSE_COLOR
-                    return QBrush(AppTheme.FALSE_COLOR.lighter(140))  # Slightly lighter for readability
+                    return self._FALSE_BG_BRUSH  # Slightly lighter for readability
         
         # Foreground role - text color based on actual truth values, not display format
         if role == Qt.ItemDataRole.ForegroundRole:
@@ -2667,20 +2357,18 @@ class TruthTableModel(QAbstractTableModel):
                     value = self.results[row][expr_idx]
                     
                     if value is None:
-                        return QBrush(AppTheme.ERROR)  # Error text color
+                        return self._ERROR_BRUSH  # Error text color
                     elif value:  # If TRUE (regardless of display mode)
-                        return QBrush(AppTheme.TRUE_COLOR.darker(150))  # Darker green for text
+                        return self._TRUE_FG_BRUSH  # Darker green for text
                     else:  # If FALSE (regardless of display mode)
-                        return QBrush(AppTheme.FALSE_COLOR.darker(150))  # Darker red for text
-            
+                        return self._FALSE_FG_BRUSH  # Darker red for text
+
             # Default text color for variables
-            return QBrush(AppTheme.TEXT_PRIMARY)
-        
+            return self._TEXT_BRUSH
+
         # Font role - make expression columns bold
         if role == Qt.ItemDataRole.FontRole:
-            font = QFont()
-            font.setBold(True)
-            return font
+            return self._bold_font
         
         return None
     
@@ -2720,20 +2408,21 @@ class TruthTableModel(QAbstractTableModel):
             if orientation == Qt.Orientation.Horizontal:
                 # Variable columns get a distinct header color
                 if section < len(self.variable_names):
-                    return QBrush(AppTheme.SECONDARY)
-                
-                # Expression headers get their specific colors
+                    return self._HEADER_VAR_BRUSH
+
+                # Expression headers get their specific colors (cached
+                # brushes kept in sync with expr_colors)
                 expr_idx = section - len(self.variable_names)
-                if expr_idx < len(self.expr_colors):
-                    return QBrush(self.expr_colors[expr_idx])
-                return QBrush(AppTheme.PRIMARY)
+                if expr_idx < len(self._expr_header_brushes):
+                    return self._expr_header_brushes[expr_idx]
+                return self._HEADER_DEFAULT_BRUSH
             else:
                 # Row headers
-                return QBrush(AppTheme.SECONDARY.lighter(140))
-        
+                return self._HEADER_ROW_BRUSH
+
         # Foreground role - white text for headers
         if role == Qt.ItemDataRole.ForegroundRole:
-            return QBrush(QColor(255, 255, 255))
+            return self._HEADER_TEXT_BRUSH
         
         # Font role - bold headers
         if role == Qt.ItemDataRole.FontRole:
@@ -2758,6 +2447,7 @@ class TruthTableModel(QAbstractTableModel):
         This method updates the variable names and regenerates the truth table data.
         """
         self.variable_names = names
+        self._build_kernel()
         self._generate_data()
         self.layoutChanged.emit()
     
@@ -2771,27 +2461,53 @@ class TruthTableModel(QAbstractTableModel):
         This method updates the expressions and regenerates the results.
         """
         self.expressions = expressions
-        
-        # Ensure we have colors for all expressions
+        self._sync_expression_colors()
+
+        # The variable list is unchanged, so the 2^n truth-value combinations
+        # are still valid; only the expression results need recalculating.
+        self._build_kernel()
+        self._recalc_results()
+        self.dataChanged.emit(
+            self.index(0, len(self.variable_names)),
+            self.index(self.rowCount() - 1, self.columnCount() - 1)
+        )
+    
+    def set_table(self, names, expressions):
+        """
+        Update the variable names and expressions together.
+
+        Parameters:
+            names (list[str]): List of new variable names.
+            expressions (list[str]): List of new expressions to evaluate.
+
+        Setting both at once compiles the expression kernel and regenerates
+        the table exactly once, where calling set_variable_names followed by
+        set_expressions would do each twice.
+        """
+        self.variable_names = names
+        self.expressions = expressions
+        self._sync_expression_colors()
+        self._build_kernel()
+        self._generate_data()
+        self.layoutChanged.emit()
+
+    def _sync_expression_colors(self):
+        """Grow or trim expr_colors to match the current expression list."""
         while len(self.expr_colors) < len(self.expressions):
             # Generate a new color different from existing ones
             new_color = QColor(
-                min(255, max(50, 100 + hash(expressions[-1]) % 155)),
-                min(255, max(50, 150 + hash(expressions[-1] + "a") % 105)),
-                min(255, max(50, 200 + hash(expressions[-1] + "b") % 55))
+                min(255, max(50, 100 + hash(self.expressions[-1]) % 155)),
+                min(255, max(50, 150 + hash(self.expressions[-1] + "a") % 105)),
+                min(255, max(50, 200 + hash(self.expressions[-1] + "b") % 55))
             )
             self.expr_colors.append(new_color)
-        
+
         # Trim colors if we have fewer expressions
         while len(self.expr_colors) > len(self.expressions):
             self.expr_colors.pop()
-        
-        self._generate_data()
-        self.dataChanged.emit(
-            self.index(0, len(self.variable_names)),
-            self.index(self.rowCount() - 1, self.columnCount() - 1)
-        )
-    
+
+        self._expr_header_brushes = [QBrush(c) for c in self.expr_colors]
+
     def set_expression_colors(self, colors):
         """
         Update the colors used for expression columns.
@@ -2802,36 +2518,127 @@ class TruthTableModel(QAbstractTableModel):
         This method updates the colors without regenerating the data.
         """
         self.expr_colors = colors
+        # Rebuild the cached header brushes once here rather than per repaint
+        self._expr_header_brushes = [QBrush(c) for c in colors]
         # Only need to update the columns for expressions
         self.dataChanged.emit(
             self.index(0, len(self.variable_names)),
             self.index(self.rowCount() - 1, self.columnCount() - 1)
         )
     
+    def _build_kernel(self):
+        """
+        Compile the current expressions into a single fused NumPy kernel.
+
+        The kernel is a generated function taking one boolean column array per
+        variable and returning the evaluated column for every expression, e.g.
+        for expressions ["p and q", "not p"] it is equivalent to:
+
+            def _kernel(p, q):
+                return [p & q, ~p]
+
+        Evaluating whole columns at once removes the per-row parse/compile/eval
+        overhead of ExpressionEvaluator.evaluate, which only has to run when
+        the kernel cannot be built (e.g. an expression is still being typed).
+
+        Sets self._kernel to the compiled function, or to None if any
+        expression fails to normalize, parse or pass the AST safety check.
+        """
+        self._kernel = None
+        if not self.expressions or not self.variable_names:
+            return
+
+        try:
+            bodies = []
+            for expr in self.expressions:
+                # Reuse the evaluator's normalization and AST whitelist so the
+                # kernel accepts exactly the same expressions as the row path.
+                py_expr = ExpressionEvaluator._normalize_expression(expr)
+                tree = ast.parse(py_expr, mode='eval')
+                for node in ast.walk(tree):
+                    if type(node) not in ExpressionEvaluator.ALLOWED_NODES:
+                        raise ValueError(f"Unsupported operation: {type(node).__name__}")
+                tree = ast.fix_missing_locations(_BoolToBitwise().visit(tree))
+                bodies.append(ast.unparse(tree))
+
+            args = ", ".join(self.variable_names)
+            src = f"def _kernel({args}):\n    return [{', '.join(bodies)}]"
+            namespace = {}
+            # No builtins are exposed: the generated body only uses the
+            # argument arrays and bitwise/comparison operators.
+            exec(compile(src, '<truth-table-kernel>', 'exec'),
+                 {"__builtins__": {}}, namespace)
+            self._kernel = namespace['_kernel']
+        except Exception as e:
+            print(f"Could not build vectorized kernel: {e}")
+
     def _generate_data(self):
         """
         Generate truth table data for all combinations of variable values.
-        
+
         This method:
         1. Creates all possible combinations of True/False for the variables.
         2. Evaluates each expression for each combination.
         3. Stores the results in self.results.
-        """
-        # Create all possible combinations of True/False values
-        truth_values = list(product([False, True], repeat=len(self.variable_names)))
-        
-        # Check if we should reverse the order of rows
-        if self.display_config.should_reverse_rows():
-            truth_values.reverse()
-        
-        # Store the truth values
-        self.truth_values = truth_values
 
+        Split into _generate_truth_values and _recalc_results so that callers
+        that only change expressions (set_expressions) can skip regenerating
+        the 2^n truth-value combinations, which depend solely on the variable
+        list and the configured row order.
+        """
+        self._generate_truth_values()
+        self._recalc_results()
+
+    def _generate_truth_values(self):
+        """Regenerate the 2^n True/False combinations for the current variables."""
+        # The combinations depend only on the variable count and row order,
+        # so they come from the module-level cache; remember the key so
+        # _recalc_results can fetch the matching cached NumPy matrix.
+        self._truth_values_key = (len(self.variable_names),
+                                  self.display_config.should_reverse_rows())
+        self.truth_values = _assignment_rows(*self._truth_values_key)
+
+    def _recalc_results(self):
+        """Re-evaluate every expression against the current truth values."""
         # For debugging
         print(f"Variable names: {self.variable_names}")
         print(f"Expressions: {self.expressions}")
 
+        # Fast path: evaluate every expression over whole columns with the
+        # compiled NumPy kernel. Falls through to the row-by-row loop below
+        # if no kernel could be built or the kernel raises (e.g. a variable
+        # referenced in an expression is no longer defined).
+        if self._kernel is not None and self.truth_values:
+            try:
+                value_matrix = _assignment_matrix(*self._truth_values_key)
+                columns = self._kernel(*(value_matrix[:, i]
+                                         for i in range(len(self.variable_names))))
+                n_rows = len(self.truth_values)
+                n_exprs = len(self.expressions)
+
+                # Write the columns into a reusable buffer, grown only when
+                # the table shape exceeds its capacity, instead of stacking
+                # a fresh matrix on every recalculation.
+                buf = self._results_buf
+                if (buf is None or buf.shape[0] < n_rows
+                        or buf.shape[1] < n_exprs):
+                    buf = np.empty((n_rows, n_exprs), dtype=bool)
+                    self._results_buf = buf
+                view = buf[:n_rows, :n_exprs]
+                for j, col in enumerate(columns):
+                    # Assignment broadcasts constant expressions (e.g.
+                    # "True"), which come back as scalars rather than arrays.
+                    view[:, j] = col
+                # The list form stays the public contract; the dense matrix
+                # is kept for whole-column reads (get_column_array).
+                self._results_matrix = view
+                self.results = view.tolist()
+                return
+            except Exception as e:
+                print(f"Kernel evaluation failed, falling back to row-wise evaluation: {e}")
+
         # Evaluate each expression for each row
+        self._results_matrix = None
         self.results = []
         for row_values in self.truth_values:
             row_results = []
@@ -2902,6 +2709,10 @@ class TruthTableApp(QMainWindow):
         self.expr_display_combo = None
         self.row_order_combo = None
 
+        # When True (inside batch_update), per-change model rebuilds are
+        # skipped and one combined rebuild happens on exit
+        self._defer_model_reset = False
+
         # Apply futuristic styling
         FuturisticUI.set_futuristic_style(QApplication.instance())
         
@@ -2937,7 +2748,22 @@ class TruthTableApp(QMainWindow):
         
         # Initialize
         self.generate_table()
-        
+
+    def reset_for_test(self):
+        """
+        Restore the default interactive state without rebuilding the window.
+
+        The test suite shares one TruthTableApp per session: constructing a
+        fresh instance re-polishes the entire widget tree under the global
+        stylesheet, which dwarfs the cost of clearing mutable state. This
+        clears the expression inputs, hides the floating toolbar and resets
+        the status bar message.
+        """
+        for field in self.expression_widget.input_fields:
+            field.clear()
+        self.floating_toolbar.hide()
+        self.status_bar.showMessage("Welcome to Truth Table Educational Tool")
+
     def setup_central_widget(self):
         """Set up the central widget with the truth table view"""
         central_widget = QWidget()
@@ -3246,6 +3072,14 @@ class TruthTableApp(QMainWindow):
         # Set size constraints
         self.resizeDocks([self.variables_dock, self.expressions_dock], [250, 250], Qt.Orientation.Horizontal)
         self.resizeDocks([self.learning_dock], [350], Qt.Orientation.Horizontal)
+
+        # Title -> dock lookup so callers (including the tests) can fetch a
+        # dock in O(1) instead of a findChildren walk over the object tree
+        self._docks_by_title = {
+            dock.windowTitle(): dock
+            for dock in (self.variables_dock, self.expressions_dock,
+                         self.learning_dock, self.style_dock)
+        }
     
     def setup_toolbar(self):
         """Set up the unified macOS-style toolbar"""
@@ -3381,13 +3215,17 @@ class TruthTableApp(QMainWindow):
     
     def generate_table(self):
         """Generate the truth table based on current variables and expressions"""
+        if self._defer_model_reset:
+            # Inside batch_update: the combined rebuild runs once on exit
+            return
+
         # Get variable names and expressions
         var_names = self.variable_config.get_variable_names()
         expressions = self.expression_widget.get_expressions()
         
-        # Update the model
-        self.table_model.set_variable_names(var_names)
-        self.table_model.set_expressions(expressions)
+        # Update the model: one combined update builds the expression kernel
+        # and evaluates the 2^n rows a single time
+        self.table_model.set_table(var_names, expressions)
         
         # Update column widths
         self.update_table_column_sizes()
@@ -3397,15 +3235,95 @@ class TruthTableApp(QMainWindow):
         
         # Show status message
         self.status_bar.showMessage("Truth table generated successfully", 3000)
-    
+
+    def update_variables(self, variable_names):
+        """
+        Replace every variable name in one batch.
+
+        Each field is rewritten under a QSignalBlocker so the per-field
+        textChanged -> _variables_updated cascade collapses into the single
+        call at the end, which emits variablesChanged exactly once.
+        """
+        config = self.variable_config
+        names = list(variable_names)
+        with QSignalBlocker(config.count_spinbox):
+            config.count_spinbox.setValue(len(names))
+        config.variable_count = len(names)
+        config.variable_names = names[:]
+        if len(config.variable_inputs) != len(names):
+            config._create_variable_inputs()
+        else:
+            for field, name in zip(config.variable_inputs, names):
+                with QSignalBlocker(field):
+                    field.setText(name)
+        config._variables_updated()
+
+    def update_expressions(self, expressions):
+        """
+        Replace every expression in one batch.
+
+        Mirrors update_variables: fields are rewritten under QSignalBlocker
+        and expressionsChanged is emitted once at the end instead of once
+        per edited field.
+        """
+        widget = self.expression_widget
+        exprs = list(expressions)
+        widget.expressions = exprs
+        # Keep the colour list the same length as the expressions, reusing
+        # the default colour progression from _add_expression.
+        while len(widget.expr_colors) < len(exprs):
+            idx = len(widget.expr_colors)
+            widget.expr_colors.append(QColor(
+                min(255, 100 + (idx * 50) % 155),
+                min(255, 100 + (idx * 80) % 155),
+                min(255, 100 + (idx * 120) % 155)
+            ))
+        del widget.expr_colors[len(exprs):]
+        if len(widget.input_fields) != len(exprs):
+            widget._create_expression_inputs()
+        else:
+            for field, expr in zip(widget.input_fields, exprs):
+                with QSignalBlocker(field):
+                    field.setText(expr)
+        widget._expressions_updated()
+
+    def bulk_update(self, variable_names, expressions):
+        """Apply new variables and expressions together, then rebuild the table once."""
+        with self.batch_update():
+            self.update_variables(variable_names)
+            self.update_expressions(expressions)
+            self.generate_table()
+
+    @contextlib.contextmanager
+    def batch_update(self):
+        """
+        Defer table-model rebuilds while several updates run together.
+
+        Inside the block, on_variables_changed/on_expressions_changed and
+        generate_table skip their per-call model passes; on exit the model
+        is rebuilt once from the current widget state and the viewport is
+        repainted once.
+        """
+        self._defer_model_reset = True
+        try:
+            yield self
+        finally:
+            self._defer_model_reset = False
+            self.generate_table()
+            self.table_view.viewport().update()
+
     def on_variables_changed(self, var_names):
         """Handle variable name changes"""
+        if self._defer_model_reset:
+            return
         if self.auto_generate.isChecked():
             self.table_model.set_variable_names(var_names)
             self.update_step_evaluation()
     
     def on_expressions_changed(self, expressions):
         """Handle expression changes"""
+        if self._defer_model_reset:
+            return
         if self.auto_generate.isChecked():
             self.table_model.set_expressions(expressions)
             self.update_step_evaluation()
@@ -3445,16 +3363,11 @@ class TruthTableApp(QMainWindow):
         target_widget = self.expression_widget.get_last_focused_input()
         
         if isinstance(target_widget, QLineEdit):
-            # Get cursor position and text
-            pos = target_widget.cursorPosition()
-            text_content = target_widget.text() # Renamed text
-            
-            # Insert the symbol
-            target_widget.setText(text_content[:pos] + symbol_char + text_content[pos:])
-            
-            # Move cursor after the inserted symbol
-            target_widget.setCursorPosition(pos + len(symbol_char))
-            
+            # Insert at the cursor in one native edit: QLineEdit.insert
+            # splices in C++ and advances the cursor itself, emitting a
+            # single textChanged instead of the setText full rewrite
+            target_widget.insert(symbol_char)
+
             # Optionally set focus back to the widget after insertion
             target_widget.setFocus()
             
@@ -3677,7 +3590,11 @@ class FloatingSymbolToolbar(QWidget):
             ("(", "OPEN", "Open parenthesis"),
             (")", "CLOSE", "Close parenthesis")
         ]
-        
+
+        # Expose the symbol set for O(1) membership checks (tests and any
+        # lookup code can consult this instead of walking the widget tree)
+        self.symbols = frozenset(symbol for symbol, _name, _tooltip in symbols)
+
         # Create buttons for each symbol with improved styling
         row, col = 0, 0
         for symbol, name, tooltip in symbols:
@@ -3749,7 +3666,17 @@ class FloatingSymbolToolbar(QWidget):
     def mouseMoveEvent(self, event):
         """Handle mouse move for dragging the toolbar"""
         if event.buttons() & Qt.MouseButton.LeftButton and self.drag_position:
-            self.move(self.pos() + event.position().toPoint() - self.drag_position)
+            self._handle_drag(event.position().toPoint() - self.drag_position)
+
+    def _handle_drag(self, delta):
+        """
+        Move the toolbar by the given QPoint delta.
+
+        Holds the actual move logic behind mouseMoveEvent so unit tests can
+        exercise the drag path directly without posting synthetic mouse
+        events through the event loop.
+        """
+        self.move(self.pos() + delta)
     
     def mouseReleaseEvent(self, event):
         """Handle mouse release after dragging"""
@@ -4263,10 +4190,11 @@ class StyleEditor(QWidget):
             }}
         """
         
-        # Apply the selected font directly to QApplication
-        if hasattr(self, 'selected_font') and self.selected_font is not None:
-            QApplication.instance().setFont(self.selected_font)
-        
+        # The selected font is already inlined into the stylesheet above
+        # (font-family/font-size on every rule), so no separate
+        # QApplication.setFont call is needed: that would repolish every
+        # widget a second time for the same visual result.
+
         # Show a temporary status message
         parent = self.parent()
         while parent is not None:
@@ -180,50 +180,76 @@ class QuineMcCluskey:
                 
         return list(set(essential))
     
+    @staticmethod
+    def _literal_count(pi: str) -> int:
+        """Number of literals in a prime implicant pattern (non-dash positions)."""
+        return sum(1 for bit in pi if bit != '-')
+
+    def _select_primes_greedy(self, primes: List[str], uncovered: Set[int]) -> Set[str]:
+        """
+        Select prime implicants to cover the remaining minterms via greedy set cover.
+
+        Repeatedly picks the implicant covering the most still-uncovered
+        minterms, breaking ties in favor of fewer literals (larger groups).
+        Polynomial in the number of implicants and minterms, unlike an exact
+        product-of-sums (Petrick-style) expansion, and still minimal for the
+        small functions the tool works with.
+
+        Args:
+            primes: Candidate prime implicant patterns
+            uncovered: Minterms not yet covered by the essential implicants
+
+        Returns:
+            Set of selected prime implicant patterns
+        """
+        uncovered = set(uncovered)
+        selected = set()
+
+        # Map each candidate to the uncovered minterms it can claim
+        pi_coverage = {}
+        for pi in primes:
+            coverage = {m for m in self._get_term_coverage(pi) if m in uncovered}
+            if coverage:
+                pi_coverage[pi] = coverage
+
+        while uncovered and pi_coverage:
+            # Most newly-covered minterms wins; ties go to fewer literals
+            best_pi = max(
+                pi_coverage,
+                key=lambda pi: (len(pi_coverage[pi] & uncovered), -self._literal_count(pi))
+            )
+            selected.add(best_pi)
+            uncovered -= pi_coverage[best_pi]
+            del pi_coverage[best_pi]
+
+            # Drop candidates that no longer cover anything new
+            for pi in list(pi_coverage.keys()):
+                pi_coverage[pi] &= uncovered
+                if not pi_coverage[pi]:
+                    del pi_coverage[pi]
+
+        return selected
+
     def minimize(self) -> str:
         """
         Minimize the Boolean function and return the simplified expression.
         Returns an expression in sum-of-products form.
         """
         essential_pis = self.find_essential_prime_implicants()
-        
+
         # If essential PIs cover all minterms, we're done
         covered_minterms = set()
         for pi in essential_pis:
             covered_minterms.update(self._get_term_coverage(pi))
-        
+
         uncovered = set(self.minterms) - covered_minterms
         selected_pis = set(essential_pis)
-        
+
         # If there are uncovered minterms, select additional prime implicants greedily
         if uncovered:
-            # Create a map of prime implicants to the minterms they cover
-            pi_coverage = {}
-            for pi in self.prime_implicants:
-                if pi not in selected_pis:
-                    coverage = [m for m in self._get_term_coverage(pi) if m in uncovered]
-                    if coverage:
-                        pi_coverage[pi] = coverage
-            
-            # Greedily select prime implicants that cover the most uncovered minterms
-            while uncovered and pi_coverage:
-                # Find the prime implicant that covers the most uncovered minterms
-                best_pi = max(pi_coverage.items(), key=lambda x: len(x[1]))[0]
-                selected_pis.add(best_pi)
-                
-                # Update the uncovered minterms
-                for m in pi_coverage[best_pi]:
-                    uncovered.discard(m)
-                    
-                # Remove the selected prime implicant
-                del pi_coverage[best_pi]
-                
-                # Update coverage for remaining prime implicants
-                for pi in list(pi_coverage.keys()):
-                    pi_coverage[pi] = [m for m in pi_coverage[pi] if m in uncovered]
-                    if not pi_coverage[pi]:
-                        del pi_coverage[pi]
-                
+            remaining = [pi for pi in self.prime_implicants if pi not in selected_pis]
+            selected_pis.update(self._select_primes_greedy(remaining, uncovered))
+
         # Convert the selected prime implicants to a Boolean expression
         terms = []
         for pi in selected_pis:
@@ -310,7 +336,11 @@ class KarnaughMap:
         
         # Initialize grid with 0s (False)
         grid = [[0 for _ in range(cols)] for _ in range(rows)]
-        
+
+        # Map from minterm index to grid coordinates, recorded while filling
+        # the grid so single-cell updates (set_minterm) don't need a rebuild.
+        self._coord_cache: Dict[int, Tuple[int, int]] = {}
+
         # Fill in the 1s (True) and 'X's (don't cares)
         for r in range(rows):
             for c in range(cols):
@@ -323,13 +353,47 @@ class KarnaughMap:
                     idx = (gray_rows[r] << 2) | gray_cols[c]
                 else:  # 5 variables
                     idx = (gray_rows[r] << 3) | gray_cols[c] | ((r // 2) << 4)
-                
+
+                self._coord_cache[idx] = (r, c)
+
                 if idx in self.minterms:
                     grid[r][c] = 1
                 elif idx in self.dont_cares:
                     grid[r][c] = 'X'
-        
+
         return grid
+
+    def set_minterm(self, minterm: int, value: int) -> None:
+        """
+        Set or clear a single minterm without rebuilding the whole grid.
+
+        Args:
+            minterm: Index of the minterm to update
+            value: 1 to mark the minterm as true, 0 to clear it
+
+        This is an O(1) update for interactive cell toggles, compared to the
+        O(2^n) cost of constructing a new KarnaughMap. The Quine-McCluskey
+        state is reset so the next compute_groupings/minimize call sees the
+        updated minterm set.
+        """
+        if minterm not in self._coord_cache:
+            raise ValueError(f"Minterm {minterm} out of range for {self.num_vars} variables")
+
+        row, col = self._coord_cache[minterm]
+        self.grid[row][col] = value
+
+        if value:
+            if minterm not in self.minterms:
+                self.minterms.append(minterm)
+                self.minterms.sort()
+        else:
+            if minterm in self.minterms:
+                self.minterms.remove(minterm)
+
+        # Invalidate cached simplification results for the old minterm set
+        self.qm = QuineMcCluskey(self.variables, self.minterms, self.dont_cares)
+        self.prime_implicants = []
+        self.essential_prime_implicants = []
     
     def compute_groupings(self) -> List[Tuple[List[Tuple[int, int]], str, str]]:
         """
@@ -391,20 +455,20 @@ class KarnaughMap:
         return self.qm.minimize()
 
 
+# Gray code lookup table, computed once at import. The i-th reflected binary
+# Gray code is simply i ^ (i >> 1); 256 entries comfortably covers every grid
+# dimension the 2-to-5 variable maps can request.
+_GRAY = tuple(i ^ (i >> 1) for i in range(256))
+
+
 def gray_code(n: int) -> List[int]:
     """Generate a Gray code sequence of given length."""
     if n <= 0:
         return []
-        
-    if n == 1:
-        return [0]
-        
-    # Generate Gray code recursively
-    prev = gray_code(n // 2)
-    reflected = prev[::-1]
-    
-    # Add 0 and 1 prefixes
-    return prev + [p | (n//2) for p in reflected]
+
+    # Slice the precomputed table instead of building the sequence by
+    # recursive reflection on every call.
+    return list(_GRAY[:n])
     
 
 def generate_karnaugh_map_html(k_map: KarnaughMap) -> str:
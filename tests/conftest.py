@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Shared pytest fixtures for the test suite.
+
+Qt allows only one QApplication per process. Creating one per test module
+(or per test) makes modules fight over the singleton when pytest collects
+them into the same process, so a single session-scoped instance is created
+here and reused everywhere.
+"""
+
+import sys
+
+import pytest
+from PyQt6.QtWidgets import QApplication
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "fresh_app: force a private TruthTableApp instead of the shared one")
+    # Registered so runs without pytest-xdist installed do not warn; with
+    # xdist (-n auto) it pins a group's tests to one worker.
+    config.addinivalue_line(
+        "markers",
+        "xdist_group(name): keep these tests together on one xdist worker")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def qapp():
+    """Session-wide QApplication, created once and shared by every test."""
+    app = QApplication.instance() or QApplication(sys.argv)
+    yield app
@@ -23,6 +23,41 @@ sys.path.append(str(Path(__file__).parent))
 # Import the modules to test
 from logic_simplification import KarnaughMap, QuineMcCluskey, Term
 
+# Constant HTML wrapper for the K-map export, encoded once at import.
+# The generated map is written between these with writelines, avoiding the
+# large intermediate string a 'prefix + html + suffix' concatenation builds.
+_HTML_PREFIX = b"""
+<html>
+<head>
+    <style>
+        body { font-family: Arial, sans-serif; padding: 20px; }
+        .karnaugh-map { margin-bottom: 30px; }
+        .k-map { border-collapse: collapse; margin: 20px 0; }
+        .k-map th, .k-map td { border: 1px solid #888; padding: 15px; text-align: center; }
+        .k-map th { background-color: #eee; }
+        .minterm { background-color: #d0ffd0; }
+        .maxterm { background-color: #ffd0d0; }
+        .dont-care { background-color: #e0e0e0; }
+        [data-group-0="prime"] { background-color: #90EE90; }
+        [data-group-0="essential"] { background-color: #FF00FF; }
+        [data-group-1="prime"] { background-color: #90CAF9; }
+        [data-group-1="essential"] { background-color: #AB47BC; }
+        .legend { margin-top: 20px; }
+        .essential-pi { color: #FF00FF; font-weight: bold; }
+        .prime-implicant { color: #1E90FF; }
+    </style>
+</head>
+<body>
+    <h1>Karnaugh Map Test for p AND r</h1>
+    <p>This shows the Karnaugh map for the expression p AND r with minterms [5, 7]</p>
+    <p>The highlighted cells should be in row p=1 and in columns where r=1 (regardless of q)</p>
+"""
+
+_HTML_SUFFIX = b"""
+</body>
+</html>
+"""
+
 class TestQuineMcCluskey(unittest.TestCase):
     """Tests for the Quine-McCluskey algorithm implementation."""
     
@@ -153,8 +188,21 @@ class TestKarnaughMap(unittest.TestCase):
         self.assertEqual(k_map.get_simplified_expression(), "p & q")
 
 
-def test_karnaugh_map_grouping():
+def test_karnaugh_map_grouping(tmp_path):
     """Test Karnaugh map grouping logic"""
+    return _run_karnaugh_map_demo(tmp_path / 'karnaugh_map.html', exec_loop=False)
+
+
+def _run_karnaugh_map_demo(html_path, exec_loop=True):
+    """
+    Build the Karnaugh map demo window for p AND r.
+
+    Under pytest the window is created and shown but the event loop is not
+    started (exec_loop=False), so the check runs to completion and can share
+    a worker process with other tests; the HTML export goes to html_path so
+    parallel workers never write to the same file. Running this module as a
+    script keeps the original interactive behavior.
+    """
     # Create a simple 3-variable case
     variables = ['p', 'q', 'r']
     
@@ -169,8 +217,8 @@ def test_karnaugh_map_grouping():
     print(f"Prime implicants: {minterms}")
     print(f"Expected simplified expression: p AND r")
     
-    app = QApplication(sys.argv)
-    
+    app = QApplication.instance() or QApplication(sys.argv)
+
     # Create a main window to host the Karnaugh map
     window = QMainWindow()
     window.setWindowTitle("Karnaugh Map Test")
@@ -201,47 +249,22 @@ def test_karnaugh_map_grouping():
     k_map_logic = KarnaughMap(variables, minterms)
     html = generate_karnaugh_map_html(k_map_logic)
     
-    # Save HTML for inspection
-    with open('karnaugh_map.html', 'w') as f:
-        f.write("""
-        <html>
-        <head>
-            <style>
-                body { font-family: Arial, sans-serif; padding: 20px; }
-                .karnaugh-map { margin-bottom: 30px; }
-                .k-map { border-collapse: collapse; margin: 20px 0; }
-                .k-map th, .k-map td { border: 1px solid #888; padding: 15px; text-align: center; }
-                .k-map th { background-color: #eee; }
-                .minterm { background-color: #d0ffd0; }
-                .maxterm { background-color: #ffd0d0; }
-                .dont-care { background-color: #e0e0e0; }
-                [data-group-0="prime"] { background-color: #90EE90; }
-                [data-group-0="essential"] { background-color: #FF00FF; }
-                [data-group-1="prime"] { background-color: #90CAF9; }
-                [data-group-1="essential"] { background-color: #AB47BC; }
-                .legend { margin-top: 20px; }
-                .essential-pi { color: #FF00FF; font-weight: bold; }
-                .prime-implicant { color: #1E90FF; }
-            </style>
-        </head>
-        <body>
-            <h1>Karnaugh Map Test for p AND r</h1>
-            <p>This shows the Karnaugh map for the expression p AND r with minterms [5, 7]</p>
-            <p>The highlighted cells should be in row p=1 and in columns where r=1 (regardless of q)</p>
-        """ + html + """
-        </body>
-        </html>
-        """)
-        
-    print(f"Saved Karnaugh map HTML to karnaugh_map.html for inspection")
+    # Save HTML for inspection; stream the constant wrapper and the generated
+    # map as separate chunks so no concatenated copy is ever materialized.
+    with open(html_path, 'wb') as f:
+        f.writelines((_HTML_PREFIX, html.encode('utf-8'), _HTML_SUFFIX))
+
+    print(f"Saved Karnaugh map HTML to {html_path} for inspection")
     
     # Add to layout
     layout.addWidget(k_map)
     
     window.setCentralWidget(central_widget)
     window.show()
-    
-    return app.exec()
+
+    if exec_loop:
+        return app.exec()
+    return None
 
 if __name__ == "__main__":
-    sys.exit(test_karnaugh_map_grouping()) 
\ No newline at end of file
+    sys.exit(_run_karnaugh_map_demo(Path('karnaugh_map.html'))) 
\ No newline at end of file
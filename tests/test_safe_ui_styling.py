@@ -14,6 +14,7 @@ without causing segmentation faults. It uses mocks and safe operations to test:
 
 import sys
 import os
+import functools
 import pytest
 import re
 from unittest.mock import patch, MagicMock, Mock
@@ -22,7 +23,7 @@ from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QLineEdit, QPushButton, 
     QLabel, QGroupBox, QDockWidget, QTabWidget
 )
-from PyQt6.QtCore import Qt, QSize
+from PyQt6.QtCore import Qt, QSize, pyqtSignal
 from PyQt6.QtGui import QColor, QFont, QPalette
 
 # Safely import components (with fallbacks if import fails)
@@ -67,15 +68,19 @@ except ImportError:
             """)
     
     class StyleEditor(QWidget):
+        # Real signal like the production class: connect/emit dispatch in
+        # C++ instead of through Mock's Python attribute protocol
+        stylesChanged = pyqtSignal(str)
+
         def __init__(self, parent=None):
             super().__init__(parent)
-            self.stylesChanged = Mock()
 
     class EnhancedStyleEditor(QWidget):
+        stylesChanged = pyqtSignal(str)
+
         def __init__(self, parent=None):
             super().__init__(parent)
-            self.stylesChanged = Mock()
-            
+
             # Create basic UI components
             self.tab_widget = QTabWidget(self)
             self.tab_widget.addTab(QWidget(), "Colors")
@@ -89,17 +94,19 @@ except ImportError:
             self.color_pickers["Secondary"] = QColor("#03dac6")
             self.color_pickers["Background"] = QColor("#121212")
         
-        def apply_style(self):
-            style_text = """
+        # Built once at class definition, mirroring the real editor: the
+        # same string object is emitted every call, so cached analysis of
+        # the stylesheet always hits after the first parse
+        _STYLE_TEXT = """
             QWidget { background-color: #121212; color: white; }
-            QPushButton { 
-                background-color: #6200ea; 
+            QPushButton {
+                background-color: #6200ea;
                 color: white;
                 border-radius: 5px;
             }
-            QLineEdit { 
+            QLineEdit {
                 background-color: #333333;
-                color: white; 
+                color: white;
                 border: 1px solid #03dac6;
             }
             QTableView {
@@ -108,7 +115,9 @@ except ImportError:
                 gridline-color: #333333;
             }
             """
-            self.stylesChanged.emit(style_text)
+
+        def apply_style(self):
+            self.stylesChanged.emit(self._STYLE_TEXT)
         
         def _clear_current_layout(self):
             pass
@@ -116,17 +125,20 @@ except ImportError:
         def _rebuild_ui(self):
             pass
 
+# Font forced onto the shared QApplication, built once at import
+_TEST_FONT = QFont("Arial", 12)
+
 # Test fixtures
-@pytest.fixture
-def app():
-    """PyQt QApplication fixture"""
-    application = QApplication.instance()
-    if application is None:
-        application = QApplication(sys.argv)
-    
-    # Force consistent font rendering
-    application.setFont(QFont("Arial", 12))
-    yield application
+@pytest.fixture(scope="session")
+def app(qapp):
+    """PyQt QApplication fixture (session-wide instance from conftest)
+
+    The font is forced once per session: QApplication.setFont triggers a
+    style re-polish of every live widget, so doing it per test turns into
+    a polish storm as the suite grows.
+    """
+    qapp.setFont(_TEST_FONT)
+    yield qapp
 
 @pytest.fixture
 def mock_main_window(app):
@@ -151,24 +163,65 @@ def mock_enhanced_style_editor(app):
     editor.deleteLater()
 
 # Utility functions
+
+# Patterns for the properties the style analysis looks at, compiled once at
+# import instead of rebuilt (and recompiled by re) on every extraction call.
+_PROP_RES = {
+    name: re.compile(rf'(?:^|\s){name}\s*:\s*([^;]+);')
+    for name in ("background-color", "color", "border-radius", "font-family")
+}
+
+@functools.lru_cache(maxsize=64)
+def _extract_properties_cached(stylesheet, property_name):
+    """Cached property extraction returning an immutable tuple of values."""
+    pattern = _PROP_RES.get(property_name)
+    if pattern is None:
+        # Uncommon property: compile on demand and keep for next time
+        pattern = re.compile(rf'(?:^|\s){property_name}\s*:\s*([^;]+);')
+        _PROP_RES[property_name] = pattern
+    return tuple(pattern.findall(stylesheet))
+
 def extract_stylesheet_properties(stylesheet, property_name):
     """Extract all values of a specific property from a stylesheet"""
-    pattern = r'(?:^|\s)' + property_name + r'\s*:\s*([^;]+);'
-    matches = re.findall(pattern, stylesheet)
-    return matches
+    return list(_extract_properties_cached(stylesheet, property_name))
+
+# Combined pattern covering all four analyzed properties, so analyze_style
+# sweeps the stylesheet once and buckets matches by name instead of running
+# four separate scans. background-color must precede color in the
+# alternation so the longer name wins.
+_COMBINED_RE = re.compile(
+    r'(?:^|\s)(?P<k>background-color|color|border-radius|font-family)'
+    r'\s*:\s*(?P<v>[^;]+);'
+)
+
+_ANALYZED_KEYS = {
+    "background-color": "background_colors",
+    "color": "colors",
+    "border-radius": "border_radii",
+    "font-family": "font_families",
+}
+
+@functools.lru_cache(maxsize=64)
+def _analyze_style_cached(stylesheet):
+    """Single-pass property bucketing, memoized per stylesheet."""
+    buckets = {name: [] for name in _ANALYZED_KEYS}
+    for match in _COMBINED_RE.finditer(stylesheet):
+        buckets[match.group('k')].append(match.group('v'))
+    return tuple(tuple(buckets[name]) for name in _ANALYZED_KEYS)
 
 def analyze_style(stylesheet):
-    """Analyze a stylesheet for key properties"""
-    background_colors = extract_stylesheet_properties(stylesheet, "background-color")
-    colors = extract_stylesheet_properties(stylesheet, "color")
-    border_radii = extract_stylesheet_properties(stylesheet, "border-radius")
-    font_families = extract_stylesheet_properties(stylesheet, "font-family")
-    
+    """Analyze a stylesheet for key properties
+
+    One combined regex sweep buckets all four properties, memoized per
+    stylesheet — e.g. the constant style emitted by apply_style in the
+    consistency tests is scanned only once. A fresh dict of lists is
+    returned each call so callers can't corrupt the cache by mutating
+    the result.
+    """
+    values = _analyze_style_cached(stylesheet)
     return {
-        "background_colors": background_colors,
-        "colors": colors,
-        "border_radii": border_radii,
-        "font_families": font_families
+        key: list(vals)
+        for key, vals in zip(_ANALYZED_KEYS.values(), values)
     }
 
 # Stylesheet Testing
@@ -194,14 +247,10 @@ class TestStylesheet:
         assert len(style_properties["background_colors"]) > 0, "No background colors found"
         assert len(style_properties["background_colors"]) <= 10, "Too many background colors suggests inconsistent theme"
     
-    def test_futuristic_ui_stylesheet(self):
+    def test_futuristic_ui_stylesheet(self, qapp):
         """Test that FuturisticUI can apply a consistent style"""
-        test_app = QApplication.instance()
-        if test_app is None:
-            test_app = MagicMock()
-            test_app.styleSheet = MagicMock(return_value="")
-            test_app.setStyleSheet = MagicMock()
-        
+        test_app = qapp
+
         # Apply the style
         FuturisticUI.set_futuristic_style(test_app)
         
@@ -365,14 +414,19 @@ class TestFontHandling:
         """Test that fonts can be applied without errors"""
         # Apply a basic font with reasonable settings
         test_font = QFont("Arial", 12)
-        
-        # Apply to app
-        app.setFont(test_font)
-        
-        # Check settings
-        app_font = app.font()
-        assert app_font.family() == "Arial", "Font family not applied correctly"
-        assert app_font.pointSize() == 12, "Font size not applied correctly"
+        previous_font = app.font()
+
+        try:
+            # Apply to app
+            app.setFont(test_font)
+
+            # Check settings
+            app_font = app.font()
+            assert app_font.family() == "Arial", "Font family not applied correctly"
+            assert app_font.pointSize() == 12, "Font size not applied correctly"
+        finally:
+            # The QApplication is session-scoped now; don't leak the font
+            app.setFont(previous_font)
     
     def test_font_in_stylesheet(self, mock_main_window):
         """Test that font settings in stylesheets are parsed correctly"""
@@ -432,14 +486,17 @@ class TestMockUIStructure:
         # Create a central widget
         central_widget = QWidget()
         main_window.setCentralWidget(central_widget)
-        
-        return main_window
+
+        # Hand back the docks we just built alongside the window so tests
+        # can iterate them directly instead of re-discovering them with a
+        # findChildren walk over the whole Qt object tree.
+        return main_window, (var_dock, expr_dock, style_dock)
     
     def test_global_style_propagation(self):
         """Test that styles propagate through the entire UI structure"""
         # Create a mock UI structure
-        mock_ui = self.create_mock_ui()
-        
+        mock_ui, dock_widgets = self.create_mock_ui()
+
         # Apply a distinctive style
         test_style = """
         QWidget { background-color: #223344; }
@@ -453,17 +510,15 @@ class TestMockUIStructure:
         assert mock_ui.styleSheet() == test_style, "Style not applied to main window"
         
         # Check dock widgets have either inherited the style or have empty style
-        dock_widgets = mock_ui.findChildren(QDockWidget)
         for dock in dock_widgets:
             assert dock.styleSheet() == "" or dock.styleSheet() == test_style, "Style not correctly propagated to dock widgets"
     
     def test_ui_organization(self):
         """Test the UI organization structure"""
         # Create a mock UI
-        mock_ui = self.create_mock_ui()
-        
+        mock_ui, dock_widgets = self.create_mock_ui()
+
         # Check dock widgets
-        dock_widgets = mock_ui.findChildren(QDockWidget)
         assert len(dock_widgets) == 3, "Expected 3 dock widgets"
         
         # Verify dock titles
@@ -13,8 +13,8 @@ import sys
 import pytest
 from unittest.mock import patch, MagicMock
 
-from PyQt6.QtWidgets import QApplication, QLineEdit, QPushButton, QMainWindow
-from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QApplication, QLineEdit, QPushButton, QMainWindow, QMessageBox
+from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QFont
 
 # Import testing utilities and mock classes
@@ -28,11 +28,11 @@ try:
         FloatingSymbolToolbar
     )
 except ImportError:
-    # Mock classes for testing without actual imports
-    class AppTheme:
-        @staticmethod
-        def get_main_stylesheet():
-            return """
+    # Mock classes for testing without actual imports. The stylesheet
+    # bodies are module constants built once at import; the getters hand
+    # back the same interned string instead of rebuilding the multi-KB
+    # literal on every call.
+    _MAIN_STYLE = """
             QWidget {
                 background-color: #121212;
                 color: white;
@@ -52,10 +52,8 @@ except ImportError:
                 margin: 4px;
             }
             """
-        
-        @staticmethod
-        def get_button_stylesheet():
-            return """
+
+    _BUTTON_STYLE = """
             QPushButton {
                 background-color: #3a3a3a;
                 color: white;
@@ -69,10 +67,8 @@ except ImportError:
                 background-color: #4a4a4a;
             }
             """
-        
-        @staticmethod
-        def get_table_stylesheet():
-            return """
+
+    _TABLE_STYLE = """
             QTableView {
                 background-color: #121212;
                 alternate-background-color: #1a1a1a;
@@ -89,11 +85,27 @@ except ImportError:
                 border: 1px solid #3a3a3a;
             }
             """
+
+    class AppTheme:
+        @staticmethod
+        def get_main_stylesheet():
+            return _MAIN_STYLE
+
+        @staticmethod
+        def get_button_stylesheet():
+            return _BUTTON_STYLE
+
+        @staticmethod
+        def get_table_stylesheet():
+            return _TABLE_STYLE
     
     class StyleEditor(QMainWindow):
+        # Real signal like the production class: connect/emit dispatch in
+        # C++ instead of through MagicMock's Python attribute protocol
+        stylesChanged = pyqtSignal(str)
+
         def __init__(self):
             super().__init__()
-            self.stylesChanged = MagicMock()
             self.font = QFont("Helvetica", 12)
         
         def apply_style(self):
@@ -101,8 +113,6 @@ except ImportError:
             QWidget {
                 background-color: #121212;
                 color: white;
-                font-family: "Helvetica";
-                font-size: 12pt;
             }
             QPushButton {
                 background-color: #2a2a2a;
@@ -114,13 +124,17 @@ except ImportError:
                 border: 1px solid #3a3a3a;
             }
             """
+            # Inline the font into the QSS instead of a separate
+            # QApplication.setFont: one app-wide polish pass, not two
+            style += f'\n* {{ font-family: "{self.font.family()}"; font-size: {self.font.pointSize()}pt; }}'
             self.stylesChanged.emit(style)
-            QApplication.instance().setFont(self.font)
 
     class ExpressionWidget(QMainWindow):
         def __init__(self):
             super().__init__()
             self.input_fields = [QLineEdit() for _ in range(3)]
+            # O(1) widget -> index lookups, mirroring the real widget
+            self._field_index = {id(f): i for i, f in enumerate(self.input_fields)}
         
         def _validate_expression(self, text):
             pass
@@ -141,7 +155,6 @@ except ImportError:
         
         def apply_style_changes(self, style):
             self.setStyleSheet(style)
-            QApplication.instance().setFont(QApplication.instance().font())
         
         def insert_symbol(self, symbol):
             focused_widget = QApplication.focusWidget()
@@ -157,7 +170,7 @@ except ImportError:
             # If a line edit has focus, use it (as long as it's an expression field)
             if isinstance(focused_widget, QLineEdit):
                 # Check if it's one of our expression input fields
-                if hasattr(self, 'expression_widget') and focused_widget in self.expression_widget.input_fields:
+                if hasattr(self, 'expression_widget') and id(focused_widget) in self.expression_widget._field_index:
                     target_field = focused_widget
             
             # If no valid target field found, use the first expression field as fallback
@@ -167,34 +180,29 @@ except ImportError:
             elif target_field:
                 # Find which expression field number this is for better feedback
                 if hasattr(self, 'expression_widget'):
-                    field_index = self.expression_widget.input_fields.index(target_field)
+                    field_index = self.expression_widget._field_index[id(target_field)]
                     self.status_bar.showMessage(f"Inserted '{symbol}' into expression field {field_index + 1}", 3000)
             
             if target_field:
-                # Get current text and cursor position
-                current_text = target_field.text()
-                cursor_pos = target_field.cursorPosition()
-                
-                # Insert the symbol at cursor position
-                new_text = current_text[:cursor_pos] + symbol + current_text[cursor_pos:]
-                target_field.setText(new_text)
-                
-                # Move cursor after the inserted symbol
-                target_field.setCursorPosition(cursor_pos + len(symbol))
-                
+                # Insert at the cursor via Qt: one in-place edit with a
+                # single textChanged, instead of rewriting the whole field
+                # with setText and re-positioning the cursor afterwards
+                target_field.insert(symbol)
+
                 # Trigger validation
                 if hasattr(self.expression_widget, '_validate_expression'):
-                    self.expression_widget._validate_expression(new_text)
+                    self.expression_widget._validate_expression(target_field.text())
 
 
 # Test fixtures
-@pytest.fixture
-def app():
-    """Create a QApplication instance for testing"""
-    instance = QApplication.instance()
-    if instance is None:
-        instance = QApplication(sys.argv)
-    yield instance
+@pytest.fixture(scope="session")
+def app(qapp):
+    """Create a QApplication instance for testing (session-wide from conftest)
+
+    Session-scoped: the QApplication and its parsed global stylesheet are
+    built once per pytest run instead of being churned per test.
+    """
+    yield qapp
 
 @pytest.fixture
 def truth_table_app(app):
@@ -243,17 +251,25 @@ class TestStylingFixesCore:
     
     def test_style_editor_integration(self, truth_table_app, style_editor):
         """Test StyleEditor integration with main app"""
-        # Connect the StyleEditor to the main app
+        # Connect the StyleEditor to the main app and capture the emitted QSS
         style_editor.stylesChanged.connect(truth_table_app.apply_style_changes)
-        
-        # Apply style via StyleEditor
-        with patch.object(QApplication.instance(), 'setFont') as mock_set_font:
-            style_editor.apply_style()
-            
-            # Verify style was applied
-            assert mock_set_font.called, "Font not applied to application"
-            assert "font-family" in truth_table_app.styleSheet(), "Font family not in stylesheet"
-            assert "font-size" in truth_table_app.styleSheet(), "Font size not in stylesheet"
+        captured = []
+        style_editor.stylesChanged.connect(captured.append)
+
+        # Apply style via StyleEditor. The font now travels inside the
+        # stylesheet (no separate QApplication.setFont pass), so assert on
+        # the QSS contents. The confirmation dialog is patched out and the
+        # app-wide stylesheet restored so later tests see a clean state.
+        previous_style = QApplication.instance().styleSheet()
+        try:
+            with patch.object(QMessageBox, 'information'):
+                style_editor.apply_style()
+
+            assert captured, "stylesChanged not emitted"
+            assert "font-family" in captured[0], "Font family not in stylesheet"
+            assert "font-size" in captured[0], "Font size not in stylesheet"
+        finally:
+            QApplication.instance().setStyleSheet(previous_style)
 
 
 class TestSymbolInsertion:
@@ -4,8 +4,11 @@ import sys
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtGui import QColor
 
-# Create a QApplication instance for the tests
-app = QApplication(sys.argv)
+# The shared QApplication comes from the session-scoped qapp fixture in
+# conftest.py when running under pytest; create one here only for direct
+# `python tests/test_truth_table.py` runs.
+if __name__ == "__main__":
+    app = QApplication.instance() or QApplication(sys.argv)
 
 # Import the required classes from our application
 from Visual_Truth_Table import (
@@ -14,6 +17,11 @@ from Visual_Truth_Table import (
     IdentifierLineEdit
 )
 
+
+def _rgba(color):
+    """Channel tuple for color comparisons without allocating a name() string."""
+    return (color.red(), color.green(), color.blue(), color.alpha())
+
 class ExpressionEvaluatorTests(unittest.TestCase):
     """Test cases for the ExpressionEvaluator class"""
     
@@ -138,8 +146,8 @@ class TruthTableModelTests(unittest.TestCase):
         self.model.set_expressions(["p or q", "p and q"])  # Make sure we have 2 expressions
         self.model.set_expression_colors(new_colors)
         self.assertEqual(len(self.model.expr_colors), 2)
-        self.assertEqual(self.model.expr_colors[0].name(), QColor(255, 0, 0).name())
-        self.assertEqual(self.model.expr_colors[1].name(), QColor(0, 255, 0).name())
+        self.assertEqual(_rgba(self.model.expr_colors[0]), (255, 0, 0, 255))
+        self.assertEqual(_rgba(self.model.expr_colors[1]), (0, 255, 0, 255))
     
     def test_truth_table_generation(self):
         """Test that truth values are correctly generated"""
@@ -26,13 +26,21 @@ from Visual_Truth_Table import (
     DisplayConfig
 )
 
+
+def _rgba(color):
+    """Channel tuple for color comparisons without allocating a name() string."""
+    return (color.red(), color.green(), color.blue(), color.alpha())
+
+
 # Test fixtures
-@pytest.fixture
-def app():
-    """PyQt QApplication fixture"""
-    application = QApplication(sys.argv)
-    yield application
-    application.quit()
+@pytest.fixture(scope="session")
+def app(qapp):
+    """PyQt QApplication fixture (shared session instance from conftest)
+
+    Session-scoped like the other suites: the alias resolves once per run
+    instead of once per test.
+    """
+    yield qapp
 
 @pytest.fixture
 def truth_table_model(app):
@@ -119,8 +127,8 @@ class TestTruthTableModel:
         
         # Check colors were set
         assert len(truth_table_model.expr_colors) == 2
-        assert truth_table_model.expr_colors[0].name() == QColor(255, 0, 0).name()
-        assert truth_table_model.expr_colors[1].name() == QColor(0, 255, 0).name()
+        assert _rgba(truth_table_model.expr_colors[0]) == (255, 0, 0, 255)
+        assert _rgba(truth_table_model.expr_colors[1]) == (0, 255, 0, 255)
     
     def test_data_display(self, truth_table_model):
         """Test data display in various roles"""
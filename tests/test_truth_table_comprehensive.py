@@ -12,6 +12,8 @@ This script contains pytest-based tests that verify:
 
 import sys
 import os
+import itertools
+import numpy as np
 import pytest
 from PyQt6.QtWidgets import QApplication, QLineEdit, QTableView, QDockWidget, QPushButton
 from PyQt6.QtCore import Qt, QPoint
@@ -30,20 +32,29 @@ from Visual_Truth_Table import (
 )
 
 # Test fixtures
-@pytest.fixture
-def app():
-    """PyQt QApplication fixture"""
-    application = QApplication(sys.argv)
-    yield application
-    application.quit()
+@pytest.fixture(scope="session")
+def app(qapp):
+    """PyQt QApplication fixture (shared session instance from conftest)
 
-@pytest.fixture
-def truth_table_app(app):
-    """Create a Truth Table app instance for testing"""
+    Session-scoped: the QApplication and its parsed global stylesheet are
+    built once per pytest run instead of being churned per test.
+    """
+    yield qapp
+
+@pytest.fixture(scope="session")
+def _truth_table_app_session(app):
+    """Build the TruthTableApp once per session; construction under the
+    global stylesheet is the expensive part, so it is shared."""
     tt_app = TruthTableApp()
     yield tt_app
     tt_app.deleteLater()
 
+@pytest.fixture
+def truth_table_app(_truth_table_app_session):
+    """Hand out the shared app, reset to its default state per test"""
+    _truth_table_app_session.reset_for_test()
+    yield _truth_table_app_session
+
 @pytest.fixture
 def floating_toolbar(app):
     """Create a floating toolbar for testing"""
@@ -73,42 +84,41 @@ class TestSymbolInsertion:
         buttons = floating_toolbar.findChildren(QPushButton)
         assert len(buttons) > 0
         
-        # We can check for some of the common symbols in the button text
-        button_texts = [btn.text() for btn in buttons]
-        
-        # At least some of these symbols should be present
-        common_symbols = ['∧', '∨', '¬', '→', '↔', '⊕']
-        found_symbols = [sym for sym in common_symbols if sym in button_texts]
-        
-        assert len(found_symbols) > 0, f"No logical symbols found in toolbar buttons: {button_texts}"
+        # At least some of these symbols should be present. The toolbar
+        # exposes its symbol set directly, so this is one set intersection
+        # instead of a list-in-list scan over button captions.
+        common_symbols = {'∧', '∨', '¬', '→', '↔', '⊕'}
+        found_symbols = floating_toolbar.symbols & common_symbols
+
+        assert found_symbols, f"No logical symbols found in toolbar: {sorted(floating_toolbar.symbols)}"
     
     def test_symbol_insertion_regular_lineedit(self, truth_table_app, qtbot):
         """Test symbol insertion into a regular QLineEdit"""
         # Get an expression line edit
         truth_table_app.show()
-        
-        with qtbot.waitExposed(truth_table_app):
-            expr_widget = truth_table_app.expression_widget
-            if hasattr(expr_widget, 'input_fields') and expr_widget.input_fields:
-                line_edit = expr_widget.input_fields[0]
-                
-                # Focus the line edit
-                line_edit.setFocus()
-                qtbot.wait(100)  # Give time for focus to take effect
-                
-                # Initial text
-                line_edit.setText("p q")
-                
-                # Call the insert_symbol method - it may insert at end or cursor position
-                # depending on implementation, so we'll test both possibilities
-                truth_table_app.insert_symbol('∧')
-                
-                # Check if symbol was inserted
-                # The implementation might insert at the end rather than cursor position
-                # so we'll accept either of these outcomes
-                text = line_edit.text()
-                assert (text == "p q∧" or text == "p∧ q"), \
-                    f"Symbol not inserted properly. Got '{text}', expected 'p q∧' or 'p∧ q'"
+
+        expr_widget = truth_table_app.expression_widget
+        if hasattr(expr_widget, 'input_fields') and expr_widget.input_fields:
+            line_edit = expr_widget.input_fields[0]
+
+            # Focus the line edit - focus is a synchronous Qt property, so a
+            # single processEvents pass is enough (no fixed wall-clock wait)
+            line_edit.setFocus()
+            QApplication.processEvents()
+
+            # Initial text
+            line_edit.setText("p q")
+
+            # Call the insert_symbol method - it may insert at end or cursor position
+            # depending on implementation, so we'll test both possibilities
+            truth_table_app.insert_symbol('∧')
+
+            # Check if symbol was inserted
+            # The implementation might insert at the end rather than cursor position
+            # so we'll accept either of these outcomes
+            text = line_edit.text()
+            assert (text == "p q∧" or text == "p∧ q"), \
+                f"Symbol not inserted properly. Got '{text}', expected 'p q∧' or 'p∧ q'"
     
     def test_no_symbol_insertion_in_identifier(self, truth_table_app, qtbot):
         """Test that symbols cannot be inserted into identifier fields"""
@@ -118,10 +128,11 @@ class TestSymbolInsertion:
         if hasattr(var_widget, 'variable_inputs') and var_widget.variable_inputs:
             id_edit = var_widget.variable_inputs[0]
             
-            # Focus the line edit
+            # Focus the line edit - no window-shown wait needed; focus takes
+            # effect synchronously once pending events are flushed
             id_edit.setFocus()
-            qtbot.waitForWindowShown(truth_table_app)
-            
+            QApplication.processEvents()
+
             # Initial text
             original_text = id_edit.text()
             
@@ -150,19 +161,18 @@ class TestSymbolInsertion:
         """Test that the floating toolbar can be dragged"""
         # Show the toolbar
         floating_toolbar.show()
-        qtbot.waitForWindowShown(floating_toolbar)
-        
+
         # Initial position
         initial_pos = floating_toolbar.pos()
-        
-        # Simulate drag operation
-        qtbot.mousePress(floating_toolbar, Qt.MouseButton.LeftButton, pos=QPoint(10, 10))
-        qtbot.mouseMove(floating_toolbar, pos=QPoint(50, 50))
-        qtbot.mouseRelease(floating_toolbar, Qt.MouseButton.LeftButton, pos=QPoint(50, 50))
-        
-        # Position should have changed
-        # Note: This test might be flaky depending on window manager
-        # assert floating_toolbar.pos() != initial_pos
+
+        # Exercise the drag logic directly: posting synthetic mouse events
+        # through the event loop was slow and flaky under some window
+        # managers, while _handle_drag covers the same move code path
+        # deterministically.
+        floating_toolbar._handle_drag(QPoint(40, 40))
+
+        # Position should have changed by exactly the drag delta
+        assert floating_toolbar.pos() == initial_pos + QPoint(40, 40)
 
 # Style editor tests
 class TestStyleEditor:
@@ -174,13 +184,9 @@ class TestStyleEditor:
         
     def test_style_editor_integration(self, truth_table_app):
         """Test that the style editor is properly integrated into the UI"""
-        # Should be accessible via a dock widget
-        style_dock = None
-        for dock in truth_table_app.findChildren(QDockWidget):
-            if dock.windowTitle() == "Style Editor":
-                style_dock = dock
-                break
-        
+        # Should be accessible via a dock widget (O(1) title lookup)
+        style_dock = truth_table_app._docks_by_title.get("Style Editor")
+
         assert style_dock is not None
         assert style_dock.widget() is truth_table_app.style_editor
     
@@ -222,29 +228,18 @@ class TestUIOrganization:
     
     def test_dock_widgets_presence(self, truth_table_app):
         """Test that all required dock widgets are present"""
+        # Dict lookups against the app's registry instead of three
+        # findChildren walks over the whole object tree
+        docks = truth_table_app._docks_by_title
+
         # Check for Variables dock
-        var_dock = None
-        for dock in truth_table_app.findChildren(QDockWidget):
-            if dock.windowTitle() == "Variables":
-                var_dock = dock
-                break
-        assert var_dock is not None
-        
+        assert docks.get("Variables") is not None
+
         # Check for Expressions dock
-        expr_dock = None
-        for dock in truth_table_app.findChildren(QDockWidget):
-            if dock.windowTitle() == "Expressions":
-                expr_dock = dock
-                break
-        assert expr_dock is not None
-        
+        assert docks.get("Expressions") is not None
+
         # Check for Educational Tools dock
-        educ_dock = None
-        for dock in truth_table_app.findChildren(QDockWidget):
-            if dock.windowTitle() == "Educational Tools":
-                educ_dock = dock
-                break
-        assert educ_dock is not None
+        assert docks.get("Educational Tools") is not None
     
     def test_central_widget(self, truth_table_app):
         """Test that the central widget contains the truth table"""
@@ -286,21 +281,34 @@ class TestExpressionEvaluation:
         assert ExpressionEvaluator.is_valid_expression("print('hello')")[0] is False  # function call
         assert ExpressionEvaluator.is_valid_expression("import os")[0] is False  # import statement
     
-    def test_expression_evaluation(self):
-        """Test that expressions are properly evaluated"""
-        # Setup variable dictionary
-        var_dict = {'p': True, 'q': False}
-        
-        # Test evaluation
-        assert ExpressionEvaluator.evaluate("p and q", var_dict) is False
-        assert ExpressionEvaluator.evaluate("p or q", var_dict) is True
-        assert ExpressionEvaluator.evaluate("not p", var_dict) is False
-        assert ExpressionEvaluator.evaluate("p", var_dict) is True
-        
-        # Test with logical symbols
-        assert ExpressionEvaluator.evaluate("p ∧ q", var_dict) is False
-        assert ExpressionEvaluator.evaluate("p ∨ q", var_dict) is True
-        assert ExpressionEvaluator.evaluate("¬p", var_dict) is False
+    @pytest.mark.parametrize("expr, expected_fn", [
+        ("p and q", lambda p, q: p & q),
+        ("p or q", lambda p, q: p | q),
+        ("not p", lambda p, q: ~p),
+        ("p", lambda p, q: p),
+        ("p ∧ q", lambda p, q: p & q),
+        ("p ∨ q", lambda p, q: p | q),
+        ("¬p", lambda p, q: ~p),
+    ], ids=lambda val: val if isinstance(val, str) else None)
+    def test_expression_evaluation(self, expr, expected_fn):
+        """Test that expressions are properly evaluated
+
+        The expected values are computed vectorized over every 2^n truth
+        assignment with NumPy boolean operators, so each expression is
+        checked against its full truth table rather than one hand-picked
+        variable dictionary. Each expression is its own parametrized case;
+        the evaluator's _parsed cache means the normalize + AST safety walk
+        + compile happens once per unique expression across all cases.
+        """
+        assignments = np.array(list(itertools.product([False, True], repeat=2)))
+        p, q = assignments[:, 0], assignments[:, 1]
+        expected = expected_fn(p, q)
+
+        evaluated = np.fromiter(
+            (ExpressionEvaluator.evaluate(expr, {'p': bool(pv), 'q': bool(qv)})
+             for pv, qv in assignments),
+            dtype=bool, count=len(assignments))
+        assert np.array_equal(evaluated, expected), f"Wrong column for {expr!r}"
     
     def test_symbol_normalization(self):
         """Test that logical symbols are properly normalized"""
@@ -344,43 +352,33 @@ class TestTableGeneration:
     
     def test_table_model_columns(self, truth_table_app):
         """Test that the table model has the correct columns"""
-        # Set variables
-        truth_table_app.update_variables(["p", "q"])
-        
-        # Set expressions
-        truth_table_app.update_expressions(["p and q"])
-        
-        # Generate table
-        truth_table_app.generate_table()
-        
+        # Apply variables and expressions in one batch: the model is
+        # rebuilt once on exit instead of once per call
+        with truth_table_app.batch_update():
+            truth_table_app.update_variables(["p", "q"])
+            truth_table_app.update_expressions(["p and q"])
+            truth_table_app.generate_table()
+
         # Check column count (should be variables + expressions)
         assert truth_table_app.table_model.columnCount() == 3  # p, q, (p and q)
     
     def test_table_model_rows(self, truth_table_app):
         """Test that the table model has the correct number of rows"""
-        # Set variables
-        truth_table_app.update_variables(["p", "q"])
-        
-        # Set expressions
-        truth_table_app.update_expressions(["p and q"])
-        
-        # Generate table
-        truth_table_app.generate_table()
-        
+        with truth_table_app.batch_update():
+            truth_table_app.update_variables(["p", "q"])
+            truth_table_app.update_expressions(["p and q"])
+            truth_table_app.generate_table()
+
         # Check row count (should be 2^n where n is the number of variables)
         assert truth_table_app.table_model.rowCount() == 4  # 2^2 = 4
     
     def test_table_data_accuracy(self, truth_table_app):
         """Test that the table data is accurate"""
-        # Set variables
-        truth_table_app.update_variables(["p"])
-        
-        # Set expressions
-        truth_table_app.update_expressions(["not p"])
-        
-        # Generate table
-        truth_table_app.generate_table()
-        
+        with truth_table_app.batch_update():
+            truth_table_app.update_variables(["p"])
+            truth_table_app.update_expressions(["not p"])
+            truth_table_app.generate_table()
+
         # Check data at specific cells
         # This will depend on your row ordering, adjust as needed
         # Row 0, Column 0 (p = False)
@@ -391,9 +389,15 @@ class TestTableGeneration:
         
         # Row 0, Column 1 (not p = True)
         assert truth_table_app.table_model.data(
-            truth_table_app.table_model.index(0, 1), 
+            truth_table_app.table_model.index(0, 1),
             Qt.ItemDataRole.DisplayRole
         ) in ["T", "1"]  # Depending on display mode
+
+        # Whole-column check: fetch both columns as boolean arrays and
+        # verify the expression column in one vectorized comparison
+        col_p = truth_table_app.table_model.get_column_array(0)
+        col_not_p = truth_table_app.table_model.get_column_array(1)
+        assert np.array_equal(col_not_p, ~col_p)
     
     def test_display_mode_changes(self, truth_table_app, qtbot):
         """Test that display mode changes update the table"""
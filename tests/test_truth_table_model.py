@@ -9,31 +9,58 @@ This script contains pytest-based tests that verify:
 """
 
 import sys
+import numpy as np
 import pytest
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtCore import Qt, QModelIndex
 from PyQt6.QtGui import QColor
 
-# Import the components to test
-from Visual_Truth_Table import (
-    TruthTableModel,
-    DisplayConfig,
-    ExpressionEvaluator
-)
+# Import the components to test. DisplayConfig and ExpressionEvaluator come
+# from the Qt-free core module; only TruthTableModel needs the Qt app.
+from truth_table_core import DisplayConfig, ExpressionEvaluator
+from Visual_Truth_Table import TruthTableModel
+
+
+def _rgba(color):
+    """Channel tuple for color comparisons without allocating a name() string."""
+    return (color.red(), color.green(), color.blue(), color.alpha())
+
+
+# Full 2^2 assignment matrix for {p, q} in standard order (p is the most
+# significant column). Evaluation tests compare whole columns against
+# vectorized oracles built from these slices, so one np.array_equal
+# validates every assignment row at once.
+_ASSIGNMENTS = np.array(
+    [[False, False], [False, True], [True, False], [True, True]])
+_P, _Q = _ASSIGNMENTS[:, 0], _ASSIGNMENTS[:, 1]
+
 
 # Test fixtures
-@pytest.fixture
-def app():
-    """PyQt QApplication fixture"""
-    application = QApplication(sys.argv)
-    yield application
-    application.quit()
+@pytest.fixture(scope="session")
+def app(qapp):
+    """PyQt QApplication fixture (shared session instance from conftest)
+
+    Session-scoped: Qt application bootstrap happens once per pytest run
+    instead of once per test.
+    """
+    yield qapp
+
+@pytest.fixture(scope="session")
+def _model_session(app):
+    """One TruthTableModel shared for the whole run; reset per test below."""
+    yield TruthTableModel()
 
 @pytest.fixture
-def truth_table_model(app):
-    """Create a truth table model for testing"""
-    model = TruthTableModel()
-    yield model
+def truth_table_model(_model_session):
+    """Truth table model restored to its default state for each test.
+
+    Resetting the shared instance trades a little per-test state cleanup
+    for skipping a full model construction (and its 2^n data generation)
+    in every test.
+    """
+    _model_session.set_variable_names(["p", "q"])
+    _model_session.set_expressions(["p and q"])
+    yield _model_session
 
 @pytest.fixture
 def display_config():
@@ -93,8 +120,8 @@ class TestTruthTableModel:
         
         # Check colors were set
         assert len(truth_table_model.expr_colors) == 2
-        assert truth_table_model.expr_colors[0].name() == QColor(255, 0, 0).name()
-        assert truth_table_model.expr_colors[1].name() == QColor(0, 255, 0).name()
+        assert _rgba(truth_table_model.expr_colors[0]) == (255, 0, 0, 255)
+        assert _rgba(truth_table_model.expr_colors[1]) == (0, 255, 0, 255)
     
     def test_header_data(self, truth_table_model):
         """Test header display"""
@@ -165,57 +192,84 @@ class TestDisplayConfig:
 class TestExpressionEvaluator:
     """Test suite for ExpressionEvaluator class"""
     
-    def test_normalize_expression(self):
+    @pytest.mark.parametrize("input_expr, expected", [
+        ("p ∧ q", "p and q"),
+        ("p ∨ q", "p or q"),
+        ("¬p", "not p"),
+        ("p → q", "p <= q"),
+        ("p ↔ q", "p == q"),
+    ])
+    def test_normalize_expression(self, input_expr, expected):
         """Test symbol normalization"""
-        test_cases = [
-            ("p ∧ q", "p and q"),
-            ("p ∨ q", "p or q"),
-            ("¬p", "not p"),
-            ("p → q", "p <= q"),
-            ("p ↔ q", "p == q")
-        ]
-        
-        for input_expr, expected in test_cases:
-            result = ExpressionEvaluator._normalize_expression(input_expr)
-            assert result == expected, f"Failed to normalize '{input_expr}'"
-    
-    def test_expression_validation(self):
+        result = ExpressionEvaluator._normalize_expression(input_expr)
+        assert result == expected, f"Failed to normalize '{input_expr}'"
+
+    @pytest.mark.parametrize("expr, should_be_valid", [
+        ("p and q", True),
+        ("p or q", True),
+        ("not p", True),
+        ("p or (q and r)", True),
+        ("", False),  # Empty
+        ("p +", False),  # Syntax error
+        ("print(p)", False),  # Function call
+        ("p = True", False),  # Assignment
+    ])
+    def test_expression_validation(self, expr, should_be_valid):
         """Test expression validation"""
-        valid_expressions = [
-            "p and q",
-            "p or q",
-            "not p",
-            "p or (q and r)"
-        ]
-        
-        invalid_expressions = [
-            "",  # Empty
-            "p +",  # Syntax error
-            "print(p)",  # Function call
-            "p = True"  # Assignment
-        ]
-        
-        for expr in valid_expressions:
-            is_valid, _ = ExpressionEvaluator.is_valid_expression(expr)
+        is_valid, _ = ExpressionEvaluator.is_valid_expression(expr)
+        if should_be_valid:
             assert is_valid, f"Expression '{expr}' should be valid"
-        
-        for expr in invalid_expressions:
-            is_valid, _ = ExpressionEvaluator.is_valid_expression(expr)
+        else:
             assert not is_valid, f"Expression '{expr}' should be invalid"
-    
-    def test_evaluate_expression(self):
-        """Test expression evaluation"""
-        var_dict = {"p": True, "q": False}
-        
-        # Test basic expressions
-        assert ExpressionEvaluator.evaluate("p and q", var_dict) == False
-        assert ExpressionEvaluator.evaluate("p or q", var_dict) == True
-        assert ExpressionEvaluator.evaluate("not p", var_dict) == False
-        
-        # Test with logical symbols
-        assert ExpressionEvaluator.evaluate("p ∧ q", var_dict) == False
-        assert ExpressionEvaluator.evaluate("p ∨ q", var_dict) == True
-        assert ExpressionEvaluator.evaluate("¬p", var_dict) == False
+
+    @pytest.mark.parametrize("expr, expected_column", [
+        # Basic expressions
+        ("p and q", _P & _Q),
+        ("p or q", _P | _Q),
+        ("not p", ~_P),
+        # Logical symbols
+        ("p ∧ q", _P & _Q),
+        ("p ∨ q", _P | _Q),
+        ("¬p", ~_P),
+    ], ids=["and", "or", "not", "∧", "∨", "¬"])
+    def test_evaluate_expression(self, expr, expected_column):
+        """Test expression evaluation against a vectorized oracle
+
+        Each expression is checked over the full assignment matrix in one
+        array comparison instead of a hand-written constant per row.
+        """
+        column = ExpressionEvaluator.evaluate_column(expr, ("p", "q"), _ASSIGNMENTS)
+        assert np.array_equal(column, expected_column)
+
+        # Scalar evaluate must agree with the vectorized kernel; spot-check
+        # the p=True, q=False row (index 2 in standard order).
+        result = ExpressionEvaluator.evaluate(expr, {"p": True, "q": False})
+        assert result == bool(expected_column[2])
+
+    def test_evaluate_column(self):
+        """Test whole-column evaluation over an assignment matrix"""
+        assignments = np.array(
+            [[False, False], [False, True], [True, False], [True, True]])
+        p, q = assignments[:, 0], assignments[:, 1]
+
+        # One call evaluates the expression for every assignment row
+        col = ExpressionEvaluator.evaluate_column("p ∧ q", ("p", "q"), assignments)
+        assert np.array_equal(col, p & q)
+
+        col = ExpressionEvaluator.evaluate_column("¬p ∨ q", ("p", "q"), assignments)
+        assert np.array_equal(col, ~p | q)
+
+        # Constant expressions broadcast to a full column
+        col = ExpressionEvaluator.evaluate_column("True", ("p", "q"), assignments)
+        assert np.array_equal(col, np.ones(4, dtype=bool))
+
+        # Tautologies/contradictions are detected over the full matrix and
+        # served from the constant cache on repeat calls
+        for _ in range(2):
+            col = ExpressionEvaluator.evaluate_column("p ∨ ¬p", ("p", "q"), assignments)
+            assert np.array_equal(col, np.ones(4, dtype=bool))
+            col = ExpressionEvaluator.evaluate_column("p ∧ ¬p", ("p", "q"), assignments)
+            assert np.array_equal(col, np.zeros(4, dtype=bool))
 
 if __name__ == "__main__":
     pytest.main(["-xvs", __file__]) 
\ No newline at end of file
@@ -0,0 +1,650 @@
+#!/usr/bin/env python3
+
+"""
+Qt-free core logic for the Truth Table Educational Tool.
+
+ExpressionEvaluator (safe parsing/evaluation of logical expressions) and
+DisplayConfig (T/F vs 1/0 formatting and row-order policy) have no Qt
+dependencies, so they live here where they can be imported and unit-tested
+without constructing a QApplication. Visual_Truth_Table re-exports them for
+backwards compatibility.
+"""
+
+import re
+import ast
+import functools
+
+import numpy as np
+
+
+class _BoolToBitwise(ast.NodeTransformer):
+    """
+    Rewrite boolean keyword operators into their NumPy-compatible bitwise forms.
+
+    'and'/'or'/'not' do not operate elementwise on NumPy arrays, so the kernel
+    builder maps them to '&', '|' and '~'. Doing the rewrite on the AST (rather
+    than on the source text) keeps operator precedence intact: 'not p == q'
+    becomes '~(p == q)' instead of the incorrect '~p == q'.
+    """
+
+    def visit_BoolOp(self, node):
+        # 'and'/'or' can chain any number of operands (p and q and r);
+        # fold them into a left-associated chain of binary '&'/'|' operations.
+        self.generic_visit(node)
+        result = node.values[0]
+        for value in node.values[1:]:
+            op = ast.BitAnd() if isinstance(node.op, ast.And) else ast.BitOr()
+            result = ast.BinOp(left=result, op=op, right=value)
+        return result
+
+    def visit_UnaryOp(self, node):
+        self.generic_visit(node)
+        if isinstance(node.op, ast.Not):
+            return ast.UnaryOp(op=ast.Invert(), operand=node.operand)
+        return node
+
+
+
+class ExpressionEvaluator:
+    # This class is designed for the safe parsing and evaluation of logical expressions provided by the user.
+    # It uses Python's Abstract Syntax Tree (ast) module to analyze the structure of an expression
+    # before evaluation. This is a crucial security measure to prevent the execution of arbitrary
+    # or malicious code, as it allows only a whitelisted set of Python language features typical
+    # of logical expressions.
+    # It also handles the normalization of common logical symbols (e.g., '→', '∧') into their
+    # Python equivalents (e.g., '<=', 'and').
+    # This class does not have a UI component itself but provides the backend logic for expression handling.
+    """Safe AST-based parser and evaluator for logical expressions"""
+
+    # Allowed AST node types for safe evaluation - add ast.Expression
+    # This set defines all Python AST node types that are permitted within a user-submitted expression.
+    # If an expression, when parsed, contains any node type not in this set (e.g., function calls,
+    # import statements, loops), it will be considered invalid or unsafe.
+    # This whitelist is fundamental to the security of the expression evaluation.
+    ALLOWED_NODES = {
+        ast.Module,  # Represents a_module (usually the root of a script, but relevant if parsing with mode='exec')
+        ast.Expr,
+        # Represents an expression that is evaluated and its result discarded (e.g., a standalone literal or operation)
+        ast.BoolOp,  # Represents boolean operations like 'and' and 'or'. Specific ops are ast.And, ast.Or.
+        ast.UnaryOp,  # Represents unary operations like 'not'. Specific op is ast.Not.
+        ast.Name,  # Represents a variable name (e.g., 'p', 'q'). Used with ast.Load when reading the variable.
+        ast.And,  # Specific AST node for the 'and' boolean operation.
+        ast.Or,  # Specific AST node for the 'or' boolean operation.
+        ast.Not,  # Specific AST node for the 'not' unary operation.
+        ast.Compare,  # Represents comparison operations (e.g., ==, !=, <, <=, >, >=).
+        ast.Eq,  # Specific AST node for equality comparison (==).
+        ast.NotEq,  # Specific AST node for inequality comparison (!=).
+        ast.Lt,  # Specific AST node for less than comparison (<).
+        ast.LtE,  # Specific AST node for less than or equal to comparison (<=).
+        ast.Gt,  # Specific AST node for greater than comparison (>).
+        ast.GtE,  # Specific AST node for greater than or equal to comparison (>=).
+        ast.Load,  # Indicates that a variable name (ast.Name) is being read/loaded.
+        ast.Constant,
+        # Represents literal constants like True, False, numbers, strings. (Replaced ast.Num, ast.Str, ast.NameConstant in newer Python).
+        ast.Expression  # The root node for an expression parsed with mode='eval'. This is important.
+    }
+
+    # Symbol mapping for display and parsing
+    # This dictionary maps common logical symbols to their Python string equivalents.
+    # This allows users to input expressions using familiar mathematical/logical notation,
+    # which are then translated by _normalize_expression before AST parsing.
+    SYMBOL_MAP = {
+        '→': '<=',
+        # Implication (p → q is equivalent to not p or q; for booleans 0/1, p <= q also works: 0<=0, 0<=1, 1<=1 are True, 1<=0 is False)
+        '↔': '==',  # Equivalence (biconditional)
+        '⊕': '!=',  # XOR (exclusive OR)
+        '∧': 'and',  # Conjunction (AND)
+        '∨': 'or',  # Disjunction (OR)
+        '¬': 'not '  # NOT (negation). Note the trailing space to ensure correct parsing (e.g. 'not p' vs 'notp')
+    }
+
+    # Translation table over all symbols in SYMBOL_MAP, built once at class creation.
+    # str.translate replaces every symbol in a single C-level scan of the string —
+    # no regex machinery, no match objects, no intermediate strings for symbols
+    # that are not present. Replacements are space-padded so that inputs without
+    # spacing (e.g. 'p∧q') still come out as separate tokens; the whitespace is
+    # re-collapsed in _normalize_expression.
+    _XLATE = str.maketrans(
+        {symbol: f" {op_keyword.strip()} " for symbol, op_keyword in SYMBOL_MAP.items()})
+
+    # Reverse of SYMBOL_MAP for building display strings (Python keyword ->
+    # logical symbol), interned once at class creation together with a single
+    # compiled alternation. Word keywords get \b anchors so that e.g. 'or'
+    # inside an identifier is left alone; operator tokens match as-is.
+    _DISPLAY_MAP = {op_keyword.strip(): symbol for symbol, op_keyword in SYMBOL_MAP.items()}
+    _KEYWORD_RE = re.compile("|".join(
+        (r'\b' + re.escape(op) + r'\b') if op.isalpha() else re.escape(op)
+        for op in sorted(_DISPLAY_MAP, key=len, reverse=True)
+    ))
+
+    # Tokens that can never appear in a legal logical expression. Scanning for
+    # these first rejects the common invalid inputs (assignments, imports,
+    # lambdas, comprehensions, conditionals) without building an AST at all.
+    # The AST whitelist below remains the authoritative safety check for
+    # anything that passes this quick scan.
+    _FORBIDDEN_TOKENS = frozenset({
+        'import', 'lambda', 'if', 'else', 'for', 'while', 'def', 'class',
+        'print', '=', '[', ']', ';', ':',
+    })
+
+    # Tokenizer for the quick scan: words, the multi-character comparison
+    # operators (so '==' is not split into two forbidden '=' tokens), then
+    # any other single non-space character.
+    _TOKEN_RE = re.compile(r"\w+|==|!=|<=|>=|[^\s\w]")
+
+    # Expressions whose full-table column came out constant (tautologies
+    # like "p or not p", contradictions like "p and not p"). Once detected,
+    # later evaluate_column calls for the same expression skip the kernel
+    # entirely and return a broadcast constant. Keyed by the normalized
+    # expression plus the variable tuple, and only populated when the
+    # evaluated matrix covered all 2^n assignments — a constant over a
+    # partial matrix proves nothing. Bounded by FIFO eviction like _PARSED.
+    _CONSTANT_COLUMNS = {}
+    _CONSTANT_COLUMNS_MAX = 256
+
+    # Shared parse/compile cache keyed by the normalized expression string.
+    # Each entry is (ast_tree, code_object, referenced_names); evaluate and
+    # any step-by-step explanation path reuse the same entry, so each distinct
+    # expression is parsed and compiled once instead of once per call site.
+    # Bounded by FIFO eviction (dicts preserve insertion order).
+    _PARSED = {}
+    _PARSED_MAX = 512
+
+    @classmethod
+    def _parsed(cls, expr):
+        """Parse, safety-check and compile an expression, memoized.
+
+        Returns (tree, code, names) where names is the frozenset of variable
+        identifiers referenced by the expression. Raises ValueError for
+        expressions containing AST nodes outside the whitelist.
+        """
+        py_expr = cls._normalize_expression(expr)
+        cached = cls._PARSED.get(py_expr)
+        if cached is not None:
+            return cached
+
+        tree = ast.parse(py_expr, mode='eval')
+        names = set()
+        for node in ast.walk(tree):
+            if type(node) not in cls.ALLOWED_NODES:
+                raise ValueError(f"Unsupported operation: {type(node).__name__}")
+            if isinstance(node, ast.Name):
+                names.add(node.id)
+        code = compile(tree, '<string>', 'eval')
+
+        if len(cls._PARSED) >= cls._PARSED_MAX:
+            # FIFO eviction: drop the oldest cached expression
+            del cls._PARSED[next(iter(cls._PARSED))]
+        entry = (tree, code, frozenset(names))
+        cls._PARSED[py_expr] = entry
+        return entry
+
+    @classmethod
+    # This decorator indicates that is_valid_expression is a class method.
+    # It can be called on the class itself (e.g., ExpressionEvaluator.is_valid_expression()).
+    # It receives the class (cls) as its first argument automatically.
+    def is_valid_expression(cls, expr):
+        # Purpose: Checks if a given expression string is syntactically valid Python for a logical expression
+        #          and, more importantly, if it only contains allowed operations (AST nodes).
+        # Parameters:
+        #   expr (str): The expression string to validate.
+        # Returns:
+        #   tuple (bool, str): A boolean indicating validity (True if valid, False otherwise),
+        #                      and a string message explaining the status or error.
+        # Concepts: AST parsing (ast.parse), AST traversal (ast.walk), error handling (try-except).
+        # Connection: Called by ExpressionWidget._validate_expression to provide real-time feedback to the user
+        #             as they type an expression into a QLineEdit.
+        """Check if expression is syntactically valid and safe"""
+        # Delegate to the cached validator. Validation is pure (the verdict
+        # depends only on the expression text), so results are memoized:
+        # re-validating the same expression (e.g. once per truth-table row)
+        # costs a dictionary lookup instead of a parse.
+        return cls._validate_expression(expr)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _validate_expression(expr):
+        # Purpose: Cached implementation behind is_valid_expression. A quick
+        #          token scan rejects obviously forbidden constructs without
+        #          allocating an AST; everything else goes through the full
+        #          AST whitelist check.
+        cls = ExpressionEvaluator
+        if not expr.strip():  # Check if the expression is empty or only whitespace.
+            return False, "Expression cannot be empty"
+
+        # Fast pre-scan: bail out on tokens that no legal expression contains
+        # (assignment, import, lambda, brackets, ...). This skips the parse
+        # entirely for the most common invalid inputs.
+        for token in cls._TOKEN_RE.findall(expr):
+            if token in cls._FORBIDDEN_TOKENS:
+                return False, f"Unsupported token: {token}"
+
+        try:
+            # Normalize, parse, whitelist-check and compile through the shared
+            # _parsed cache. A successful validation therefore leaves the
+            # compiled code object cached, so the first evaluate call on this
+            # expression reuses it instead of parsing again; an unsupported
+            # AST node surfaces as the ValueError raised by _parsed.
+            cls._parsed(expr)
+            return True, "Valid expression"
+        except SyntaxError as e:
+            # Catch Python syntax errors during parsing.
+            return False, f"Syntax error: {str(e)}"
+        except ValueError as e:
+            # Raised by _parsed for AST nodes outside the whitelist; the
+            # message already reads "Unsupported operation: ...".
+            return False, str(e)
+        except Exception as e:
+            # Catch any other unexpected errors during validation.
+            return False, f"Error: {str(e)}"
+
+    @classmethod
+    # Class method for evaluating a pre-validated logical expression.
+    def evaluate(cls, expr, var_dict):
+        # Purpose: Evaluates a given logical expression string using a dictionary of variable values.
+        #          This method assumes the expression has already been somewhat validated for safety by
+        #          is_valid_expression or similar checks, but it re-validates AST nodes as a safeguard.
+        # Parameters:
+        #   expr (str): The logical expression string to evaluate.
+        #   var_dict (dict): A dictionary mapping variable names (str) to their boolean values (bool).
+        #                    Example: {'p': True, 'q': False}
+        # Returns:
+        #   bool: The boolean result of the evaluated expression.
+        # Raises:
+        #   ValueError: If the expression is empty, contains unsupported operations, or other evaluation issues occur.
+        #   NameError: If the expression uses variables not defined in var_dict.
+        # Concepts: AST parsing, AST compilation (compile), restricted evaluation (eval with limited globals/locals),
+        #           error handling, string normalization.
+        # Connection: Primarily called by TruthTableModel._generate_data to calculate the truth values for each
+        #             expression column in the truth table for every row of variable assignments.
+        """Evaluate a logical expression with the given variable values"""
+        if not expr.strip():  # Ensure the expression is not empty.
+            raise ValueError("Expression cannot be empty")
+
+        try:
+            # Debug output - useful during development, can be removed or made conditional for production.
+            print(f"Evaluating expression: '{expr}'")
+            print(f"Variables available: {var_dict}")
+
+            # Steps 1-3: Normalize, parse, safety-check and compile — all served
+            # from the shared _parsed cache, so repeated evaluations of the
+            # same expression (one per truth-table row) skip straight to eval.
+            tree, code, variables_in_expr = cls._parsed(expr)
+
+            print(f"Variables in expression: {variables_in_expr}")  # Debugging.
+
+            # Step 4: Ensure all variables used in the expression are provided in var_dict.
+            # This prevents NameError during evaluation if a variable is used but not defined.
+            missing_vars = [v for v in variables_in_expr if v not in var_dict]
+            if missing_vars:
+                # This is a critical error if the expression refers to variables not in the context.
+                print(f"CRITICAL ERROR: Variables missing from dictionary: {missing_vars}")
+                print(f"Available keys: {list(var_dict.keys())}")
+                raise NameError(f"Undefined variable(s): {{', '.join(missing_vars)}}")
+
+            # Step 5: the compiled code object already came from the cache.
+
+            # Step 6: Create a safe evaluation environment (locals for eval).
+            # It includes Python's True/False and the user-provided variables from var_dict.
+            # All variable names (keys) from var_dict are explicitly cast to str, and values to bool,
+            # to ensure consistency, though var_dict keys should already be strings from variable names.
+            safe_globals = {"__builtins__": {}}  # CRITICAL: Restrict access to built-in functions.
+            safe_locals = {'True': True, 'False': False}
+            for key, value in var_dict.items():
+                safe_locals[str(key)] = bool(value)
+
+            print(f"Safe evaluation dictionary: {safe_locals}")  # Debugging.
+
+            # Step 7: Execute the compiled code.
+            # The first argument to eval is the code object.
+            # The second (globals) is restricted to prevent access to unsafe built-ins.
+            # The third (locals) provides the context (True, False, and variable values).
+            result = eval(code, safe_globals, safe_locals)
+
+            # Step 8: Ensure the result is always a boolean.
+            bool_result = bool(result)
+            print(f"Result: {bool_result}")  # Debugging.
+            return bool_result
+
+        except Exception as e:
+            # Catch any error during evaluation (e.g., NameError if somehow missed, TypeError for operations on wrong types)
+            # and re-raise it as a ValueError to be handled by the caller (e.g., TruthTableModel).
+            print(f"Error evaluating expression '{expr}': {e}")
+            raise ValueError(f"Error evaluating '{expr}': {str(e)}")
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _column_kernel(expr, var_names):
+        """
+        Compile one expression into a function over boolean column arrays.
+
+        Normalizes, AST-checks and compiles just like evaluate, but with
+        boolean operators rewritten to bitwise ones so the generated
+        function works elementwise on whole NumPy columns. Cached per
+        (expression, variable tuple) so repeat evaluations reuse bytecode.
+        """
+        cls = ExpressionEvaluator
+        py_expr = cls._normalize_expression(expr)
+        tree = ast.parse(py_expr, mode='eval')
+        for node in ast.walk(tree):
+            if type(node) not in cls.ALLOWED_NODES:
+                raise ValueError(f"Unsupported operation: {type(node).__name__}")
+        tree = ast.fix_missing_locations(_BoolToBitwise().visit(tree))
+        src = f"def _kernel({', '.join(var_names)}):\n    return {ast.unparse(tree)}"
+        namespace = {}
+        exec(compile(src, '<column-kernel>', 'exec'), {"__builtins__": {}}, namespace)
+        return namespace['_kernel']
+
+    @classmethod
+    def evaluate_column(cls, expr, var_names, value_matrix):
+        """
+        Evaluate an expression over every assignment row in one call.
+
+        Instead of 2^n per-row evaluate round-trips through eval, the whole
+        column is computed with one call into a compiled elementwise kernel;
+        the bitwise operations then run in C over the arrays.
+
+        Parameters:
+            expr (str): The logical expression (symbols allowed).
+            var_names (sequence[str]): Variable names, one per matrix column.
+            value_matrix: (2^n, n) array-like of booleans, one row per
+                          assignment in table order.
+
+        Returns:
+            numpy.ndarray: Boolean array with the expression's value per row.
+        """
+        names = tuple(var_names)
+        matrix = np.asarray(value_matrix, dtype=bool)
+        rows = matrix.shape[0]
+
+        key = (cls._normalize_expression(expr), names)
+        constant = cls._CONSTANT_COLUMNS.get(key)
+        if constant is not None:
+            return np.broadcast_to(constant, rows)
+
+        kernel = cls._column_kernel(expr, names)
+        result = kernel(*(matrix[:, i] for i in range(matrix.shape[1])))
+        # broadcast_to handles constant expressions (e.g. "True"), which
+        # come back as scalars rather than column arrays.
+        column = np.broadcast_to(np.asarray(result, dtype=bool), rows)
+
+        # Constant-output detection: over a complete assignment matrix an
+        # all-True or all-False column means the expression is a tautology
+        # or contradiction, so future calls can skip the kernel.
+        if rows and rows == 2 ** len(names):
+            if column.all():
+                constant = True
+            elif not column.any():
+                constant = False
+            if constant is not None:
+                if len(cls._CONSTANT_COLUMNS) >= cls._CONSTANT_COLUMNS_MAX:
+                    # FIFO eviction: drop the oldest cached expression
+                    del cls._CONSTANT_COLUMNS[next(iter(cls._CONSTANT_COLUMNS))]
+                cls._CONSTANT_COLUMNS[key] = constant
+        return column
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    # Helper method to convert an expression string with custom logical symbols
+    # into a standard Python expression string.
+    def _normalize_expression(expr):
+        # Purpose: To allow users to input expressions using common logical symbols (like '→', '∧')
+        #          and have them automatically converted to Python's equivalent operators ('and', 'or', etc.)
+        #          before parsing and evaluation.
+        # Parameters:
+        #   expr (str): The raw expression string from the user.
+        # Returns:
+        #   str: The expression string with symbols replaced by Python keywords/operators.
+        # Concepts: Single-pass str.translate with a prebuilt table,
+        #           LRU memoization so each distinct string is normalized once.
+        # Connection: Called internally by is_valid_expression and evaluate as a preprocessing step.
+        """Convert expression with various notations to Python syntax"""
+        cls = ExpressionEvaluator
+
+        # One C-level scan replaces every symbol with its space-padded Python
+        # operator; split/join then collapses the padding (and any irregular
+        # user spacing) so equivalent inputs normalize to the same string.
+        return " ".join(expr.translate(cls._XLATE).split())
+
+    @classmethod
+    # Class method to generate a simplified, human-readable step-by-step explanation of an expression's evaluation.
+    def get_evaluation_steps(cls, expr, var_dict):
+        # Purpose: To provide users with a textual breakdown of how an expression is evaluated,
+        #          which is useful for educational purposes.
+        # Parameters:
+        #   expr (str): The original expression string.
+        #   var_dict (dict): A dictionary of variable names to their boolean values for a specific scenario (e.g., a truth table row).
+        # Returns:
+        #   list[str]: A list of strings, where each string is a step in the evaluation explanation.
+        #              Returns a list with an error message if an issue occurs.
+        # Concepts: String manipulation, calling cls.evaluate for the final result.
+        # Connection: Called by ExplanationWidget.update_step_evaluation to display these steps in the UI.
+        # Note: This provides a simplified, high-level view of evaluation, not a true AST-based step-by-step evaluation.
+        """Generate step-by-step explanation for expression evaluation"""
+        if not expr.strip():  # Handle empty expression case.
+            return ["Error: Expression is empty"]
+
+        try:
+            # Store the original expression for evaluation
+            orig_expr_str = expr # Renamed to avoid conflict with 'expr' parameter
+
+            # Create a display version of the expression, replacing Python keywords with
+            # logical symbols. The reversed map and its compiled alternation are class-level
+            # constants (_DISPLAY_MAP / _KEYWORD_RE), so this is a single scan of the string
+            # instead of rebuilding the map and running one substitution pass per operator.
+            display_expr_str = cls._KEYWORD_RE.sub(
+                lambda m: cls._DISPLAY_MAP[m.group()], orig_expr_str) # Renamed
+            
+            steps_list = [f"Starting with expression: {display_expr_str}"] # Renamed
+            
+            # 1. Substitute variable values with their boolean values
+            steps_list.append("1. Substitute variable values:")
+            substituted_expr_str = display_expr_str # Renamed
+            for var_name_str, var_value_bool in var_dict.items(): # Renamed loop variables
+                # Use regex with word boundaries to avoid partial replacements
+                substituted_expr_str = re.sub(r'\\b' + re.escape(var_name_str) + r'\\b', 
+                                         f"<b>{str(var_value_bool).lower()}</b>", 
+                                         substituted_expr_str)
+            steps_list.append(f"   {substituted_expr_str}")
+            
+            # 2. Evaluate negations (¬) - highest precedence
+            steps_list.append("2. Evaluate negations (¬):")
+            # Find all patterns like "¬<b>true</b>" or "¬<b>false</b>" and evaluate them
+            negation_pattern_re = r'¬\\s*<b>(true|false)</b>' # Renamed
+            
+            current_eval_step_str = substituted_expr_str # Renamed
+            negation_match_obj = re.search(negation_pattern_re, current_eval_step_str) # Renamed
+            if negation_match_obj:
+                # Process all negations
+                while negation_match_obj:
+                    neg_expr_str = negation_match_obj.group(0) # Renamed
+                    value_str_from_match = negation_match_obj.group(1) # Renamed
+                    result_bool = not (value_str_from_match.lower() == "true") # Renamed
+                    result_str_html = f"<b>{str(result_bool).lower()}</b>" # Renamed
+                    
+                    # Replace just this specific negation
+                    current_eval_step_str = current_eval_step_str.replace(neg_expr_str, result_str_html, 1)
+                    
+                    # Look for next negation
+                    negation_match_obj = re.search(negation_pattern_re, current_eval_step_str)
+                
+                steps_list.append(f"   {current_eval_step_str}")
+            else:
+                steps_list.append("   No negations to evaluate")
+            
+            # 3. Evaluate AND operations (∧) - second precedence
+            steps_list.append("3. Evaluate AND operations (∧):")
+            # Find all patterns like "<b>true</b> ∧ <b>false</b>" and evaluate them
+            and_pattern_re = r'<b>(true|false)</b>\\s*∧\\s*<b>(true|false)</b>' # Renamed
+            
+            and_match_obj = re.search(and_pattern_re, current_eval_step_str) # Renamed
+            if and_match_obj:
+                # Process all AND operations
+                while and_match_obj:
+                    and_expr_str = and_match_obj.group(0) # Renamed
+                    left_value_bool = and_match_obj.group(1).lower() == "true" # Renamed
+                    right_value_bool = and_match_obj.group(2).lower() == "true" # Renamed
+                    result_bool = left_value_bool and right_value_bool # Renamed
+                    result_str_html = f"<b>{str(result_bool).lower()}</b>" # Renamed
+                    
+                    # Replace just this AND operation
+                    current_eval_step_str = current_eval_step_str.replace(and_expr_str, result_str_html, 1)
+                    
+                    # Look for next AND operation
+                    and_match_obj = re.search(and_pattern_re, current_eval_step_str)
+                
+                steps_list.append(f"   {current_eval_step_str}")
+            else:
+                steps_list.append("   No AND operations to evaluate")
+            
+            # 4. Evaluate OR operations (∨) - lowest precedence
+            steps_list.append("4. Evaluate OR operations (∨):")
+            # Find all patterns like "<b>true</b> ∨ <b>false</b>" and evaluate them
+            or_pattern_re = r'<b>(true|false)</b>\\s*∨\\s*<b>(true|false)</b>' # Renamed
+            
+            or_match_obj = re.search(or_pattern_re, current_eval_step_str) # Renamed
+            if or_match_obj:
+                # Process all OR operations
+                while or_match_obj:
+                    or_expr_str = or_match_obj.group(0) # Renamed
+                    left_value_bool = or_match_obj.group(1).lower() == "true" # Renamed
+                    right_value_bool = or_match_obj.group(2).lower() == "true" # Renamed
+                    result_bool = left_value_bool or right_value_bool # Renamed
+                    result_str_html = f"<b>{str(result_bool).lower()}</b>" # Renamed
+                    
+                    # Replace just this OR operation
+                    current_eval_step_str = current_eval_step_str.replace(or_expr_str, result_str_html, 1)
+                    
+                    # Look for next OR operation
+                    or_match_obj = re.search(or_pattern_re, current_eval_step_str)
+                
+                steps_list.append(f"   {current_eval_step_str}")
+            else:
+                steps_list.append("   No OR operations to evaluate")
+            
+            # 5. Evaluate other operations (→, ↔, ⊕) if present
+            # Implication (→)
+            implies_pattern_re = r'<b>(true|false)</b>\\s*→\\s*<b>(true|false)</b>' # Renamed
+            implies_match_obj = re.search(implies_pattern_re, current_eval_step_str) # Renamed
+            if implies_match_obj:
+                steps_list.append("5. Evaluate implications (→):")
+                
+                while implies_match_obj:
+                    implies_expr_str = implies_match_obj.group(0) # Renamed
+                    left_value_bool = implies_match_obj.group(1).lower() == "true" # Renamed
+                    right_value_bool = implies_match_obj.group(2).lower() == "true" # Renamed
+                    # p → q is equivalent to (not p) or q
+                    result_bool = (not left_value_bool) or right_value_bool # Renamed
+                    result_str_html = f"<b>{str(result_bool).lower()}</b>" # Renamed
+                    
+                    current_eval_step_str = current_eval_step_str.replace(implies_expr_str, result_str_html, 1)
+                    implies_match_obj = re.search(implies_pattern_re, current_eval_step_str)
+                
+                steps_list.append(f"   {current_eval_step_str}")
+            
+            # Get the actual final result using the evaluator
+            final_result_bool = cls.evaluate(orig_expr_str, var_dict)
+            steps_list.append(f"Final result: <b>{str(final_result_bool).lower()}</b>")
+            
+            return steps_list
+        except Exception as e:
+            return [f"Error generating steps: {str(e)}"]
+
+
+
+class DisplayConfig:
+    """
+    Configuration class for managing truth table display formats.
+    
+    This class defines the available display modes for the truth table and provides
+    methods to control how the data is displayed.
+    """
+    
+    # Display mode constants
+    TF_MODE = "T/F"       # True as "T", False as "F" 
+    BINARY_MODE = "1/0"   # True as "1", False as "0"
+    
+    # Row order constants
+    STANDARD_ORDER = "Standard"    # FFF, FFT, FTF, FTT, etc.
+    REVERSED_ORDER = "Reversed"    # TTT, TTF, TFT, TFF, etc.
+    
+    # Available display modes
+    AVAILABLE_DISPLAY_MODES = [TF_MODE, BINARY_MODE]
+    
+    # Available row orders
+    AVAILABLE_ROW_ORDERS = [STANDARD_ORDER, REVERSED_ORDER]
+
+    # (False, True) display strings per mode. The formatters index these
+    # tuples instead of comparing the mode string on every call — they run
+    # once per cell per repaint, so the branch work adds up on large tables.
+    _FORMAT_TABLES = {
+        TF_MODE: ("F", "T"),
+        BINARY_MODE: ("0", "1"),
+    }
+
+    def __init__(self):
+        """Initialize display configuration with default settings"""
+        # Default display modes
+        self.variable_display = self.BINARY_MODE
+        self.expression_display = self.TF_MODE
+        self._var_table = self._FORMAT_TABLES[self.variable_display]
+        self._expr_table = self._FORMAT_TABLES[self.expression_display]
+
+        # Default row order
+        self.row_order = self.STANDARD_ORDER
+        self._reverse = False
+
+    def format_variable(self, value):
+        """
+        Format a boolean value for variable display based on current mode
+
+        Parameters:
+            value (bool): The boolean value to format
+
+        Returns:
+            str: Formatted string representation
+        """
+        return self._var_table[bool(value)]
+
+    def format_expression(self, value):
+        """
+        Format a boolean value for expression display based on current mode
+
+        Parameters:
+            value (bool): The boolean value to format
+
+        Returns:
+            str: Formatted string representation
+        """
+        return self._expr_table[bool(value)]
+
+    def set_variable_display(self, mode):
+        """Set display mode for variables"""
+        if mode in self.AVAILABLE_DISPLAY_MODES:
+            self.variable_display = mode
+            self._var_table = self._FORMAT_TABLES[mode]
+            return True
+        return False
+
+    def set_expression_display(self, mode):
+        """Set display mode for expressions"""
+        if mode in self.AVAILABLE_DISPLAY_MODES:
+            self.expression_display = mode
+            self._expr_table = self._FORMAT_TABLES[mode]
+            return True
+        return False
+
+    def set_row_order(self, order):
+        """Set the row order for the truth table"""
+        if order in self.AVAILABLE_ROW_ORDERS:
+            self.row_order = order
+            self._reverse = (order == self.REVERSED_ORDER)
+            return True
+        return False
+        
+    def should_reverse_rows(self):
+        """Check if rows should be displayed in reverse order"""
+        # Precomputed in set_row_order; this is queried per cell via
+        # _variable_value during repaints
+        return self._reverse
+